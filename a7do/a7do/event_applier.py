@@ -1,3 +1,5 @@
+from typing import Dict, Iterable, Tuple
+
 from a7do.world import WorldState
 from a7do.events import ExperienceEvent
 
@@ -30,10 +32,7 @@ def apply_event_to_world(world: WorldState, ev: ExperienceEvent):
     # People present
     for name in ev.people_present:
         if name in world.bots:
-            bot = world.bots[name]
-            bot.location = world.a7do_location
-            bot.last_seen_day = ev.day
-            bot.last_seen_event = ev.index
+            world.move_bot(name, world.a7do_location, ev.day, ev.index)
 
     # Sleep
     if ev.kind == "sleep":
@@ -47,4 +46,77 @@ def apply_event_to_world(world: WorldState, ev: ExperienceEvent):
         "kind": ev.kind,
         "place": ev.place,
         "notes": ev.notes,
-    })
\ No newline at end of file
+    })
+
+
+def apply_events_to_world(world: WorldState, events: Iterable[ExperienceEvent]) -> int:
+    """
+    Apply a batch (e.g. a whole day) in one pass. Same end state as
+    calling apply_event_to_world per event, but each bot seen is written
+    once with its last sighting, and the log gets one bulk append.
+    Returns the number of events applied.
+
+    Nothing is written until every event has been read, so an error in
+    the batch leaves the world as it was. The log is extended before the
+    world is touched; if a record cannot be stored, the world is
+    unchanged but records before it may already be in the log.
+    """
+    location = world.a7do_location
+    posture = world.a7do_posture
+    movement = transport = sleep = None
+    seen: Dict[str, Tuple[str, int, int]] = {}
+    bots = world.bots
+    records = []
+    last = None
+
+    for ev in events:
+        last = ev
+        if ev.place:
+            location = ev.place
+
+        if ev.movement:
+            movement = {
+                "from": ev.movement.get("from"),
+                "to": ev.movement.get("to"),
+                "mode": ev.movement.get("mode"),
+                "day": ev.day,
+                "event": ev.index,
+            }
+            if "posture" in ev.movement:
+                posture = ev.movement["posture"]
+
+        if ev.transport:
+            transport = ev.transport
+
+        for name in ev.people_present:
+            if name in bots:
+                seen[name] = (location, ev.day, ev.index)
+
+        if ev.kind == "sleep":
+            sleep = (location, ev.day)
+
+        records.append({
+            "day": ev.day,
+            "index": ev.index,
+            "kind": ev.kind,
+            "place": ev.place,
+            "notes": ev.notes,
+        })
+
+    if last is None:
+        return 0
+
+    world.event_log.extend(records)
+    world.current_day = last.day
+    world.current_event_index = last.index
+    world.a7do_location = location
+    world.a7do_posture = posture
+    if movement is not None:
+        world.last_movement = movement
+    if transport is not None:
+        world.last_transport = transport
+    if sleep is not None:
+        world.last_sleep_location, world.last_sleep_day = sleep
+    for name, (where, day, index) in seen.items():
+        world.move_bot(name, where, day, index)
+    return len(records)
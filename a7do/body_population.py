@@ -0,0 +1,123 @@
+# a7do/body_population.py
+
+import numpy as np
+
+from a7do.body import BiologicalState
+
+
+class BiologicalPopulation:
+    """
+    Cohort of BiologicalState bodies held as NumPy columns.
+    Same drift, clamping and cry formula as BiologicalState, applied to
+    every member (or a chosen subset) in one vectorised step.
+
+    `idx` arguments accept anything NumPy can index with: None for the
+    whole cohort, an int, a slice, an index array or a boolean mask.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.hunger = np.full(size, 0.30)
+        self.fatigue = np.full(size, 0.20)
+        self.discomfort = np.full(size, 0.10)
+        self.cry = np.zeros(size)
+
+    @staticmethod
+    def _sel(idx):
+        return slice(None) if idx is None else idx
+
+    def update(self, idx=None):
+        """Natural drift while awake."""
+        s = self._sel(idx)
+        self.hunger[s] = np.minimum(1.0, self.hunger[s] + 0.02)
+        self.fatigue[s] = np.minimum(1.0, self.fatigue[s] + 0.015)
+        self.discomfort[s] = np.minimum(1.0, self.discomfort[s] + 0.01)
+        self._recalc_cry(s)
+
+    def soothe(self, amount=0.20, idx=None):
+        s = self._sel(idx)
+        self.discomfort[s] = np.maximum(0.0, self.discomfort[s] - amount)
+        self._recalc_cry(s)
+
+    def feed(self, idx=None):
+        s = self._sel(idx)
+        self.hunger[s] = np.maximum(0.0, self.hunger[s] - 0.40)
+        self._recalc_cry(s)
+
+    def sleep(self, idx=None):
+        s = self._sel(idx)
+        self.fatigue[s] = np.maximum(0.0, self.fatigue[s] - 0.60)
+        self._recalc_cry(s)
+
+    def _recalc_cry(self, s):
+        self.cry[s] = np.minimum(
+            1.0,
+            0.5 * self.hunger[s] +
+            0.3 * self.fatigue[s] +
+            0.4 * self.discomfort[s]
+        )
+
+    def cry_level(self, idx=None) -> np.ndarray:
+        return np.round(self.cry[self._sel(idx)], 3)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, i: int) -> "BiologicalView":
+        if not -self.size <= i < self.size:
+            raise IndexError("population index out of range")
+        return BiologicalView(self, i % self.size)
+
+    @classmethod
+    def from_states(cls, states) -> "BiologicalPopulation":
+        states = list(states)
+        pop = cls(len(states))
+        pop.hunger[:] = [b.hunger for b in states]
+        pop.fatigue[:] = [b.fatigue for b in states]
+        pop.discomfort[:] = [b.discomfort for b in states]
+        pop.cry[:] = [b.cry for b in states]
+        return pop
+
+
+class BiologicalView:
+    """
+    One member of a BiologicalPopulation, read like a BiologicalState.
+    """
+
+    __slots__ = ("pop", "i")
+
+    def __init__(self, pop: BiologicalPopulation, i: int):
+        self.pop = pop
+        self.i = i
+
+    @property
+    def hunger(self) -> float:
+        return float(self.pop.hunger[self.i])
+
+    @property
+    def fatigue(self) -> float:
+        return float(self.pop.fatigue[self.i])
+
+    @property
+    def discomfort(self) -> float:
+        return float(self.pop.discomfort[self.i])
+
+    @property
+    def cry(self) -> float:
+        return float(self.pop.cry[self.i])
+
+    def cry_level(self) -> float:
+        return round(self.cry, 3)
+
+    def snapshot(self) -> dict:
+        return {
+            "hunger": round(self.hunger, 3),
+            "fatigue": round(self.fatigue, 3),
+            "discomfort": round(self.discomfort, 3),
+            "cry": round(self.cry, 3),
+        }
+
+    def to_state(self) -> BiologicalState:
+        b = BiologicalState()
+        b.hunger, b.fatigue, b.discomfort, b.cry = self.hunger, self.fatigue, self.discomfort, self.cry
+        return b
@@ -0,0 +1,263 @@
+# a7do/bot_scheduler.py
+from __future__ import annotations
+
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from a7do.future_paths import FuturePathRegistry
+
+
+# A bot is fn(registry, world, profiles, mind); it may only read the three
+# state arguments and call registry.propose(...).
+BotFn = Callable[[Any, Any, Any, Any], None]
+
+
+# =========================
+# Per-tick read-only inputs
+# =========================
+
+@dataclass(frozen=True)
+class TickInputs:
+    """
+    Everything the bots may read, captured once per tick.
+    Plain or frozen data, so it is safe to share across threads and
+    picklable for a process pool. neighbour_families is the profiles'
+    cached FamilySnapshot (door list + lazy family lookup), rebuilt only
+    when the families change, so capture does not scale with the town.
+    """
+    seed: int
+    memory_size: int
+    lexicon: Dict[str, int]
+    cry: float
+    place: str
+    neighbour_families: Mapping[str, Mapping[str, str]]
+
+    @classmethod
+    def capture(cls, world, profiles, mind) -> "TickInputs":
+        schedule = getattr(mind, "schedule", None)
+        body = getattr(schedule, "body", None) or getattr(mind, "body", None)
+        spatial = getattr(schedule, "spatial", None)
+        if spatial is not None:
+            place = spatial.place_id
+        else:
+            place = getattr(schedule, "current_place", None) or getattr(world, "a7do_location", "")
+
+        return cls(
+            seed=getattr(world, "seed", 0),
+            memory_size=len(getattr(mind, "memory", ())),
+            lexicon=dict(mind.lexicon.items()),
+            cry=body.cry_level() if body is not None else 0.0,
+            place=place,
+            neighbour_families=_families(profiles),
+        )
+
+
+def _families(profiles) -> Mapping[str, Mapping[str, str]]:
+    fams = getattr(profiles, "neighbour_families", {})
+    if hasattr(fams, "snapshot"):
+        return fams.snapshot()
+    return {door: dict(fam) for door, fam in fams.items()}
+
+
+class _WorldView:
+    __slots__ = ("seed",)
+
+    def __init__(self, inputs: TickInputs):
+        self.seed = inputs.seed
+
+
+class _ProfilesView:
+    __slots__ = ("neighbour_families",)
+
+    def __init__(self, inputs: TickInputs):
+        self.neighbour_families = inputs.neighbour_families
+
+
+class _Body:
+    __slots__ = ("_cry",)
+
+    def __init__(self, cry: float):
+        self._cry = cry
+
+    def cry_level(self) -> float:
+        return self._cry
+
+
+class _Spatial:
+    __slots__ = ("place_id",)
+
+    def __init__(self, place: str):
+        self.place_id = place
+
+
+class _Schedule:
+    __slots__ = ("body", "spatial")
+
+    def __init__(self, inputs: TickInputs):
+        self.body = _Body(inputs.cry)
+        self.spatial = _Spatial(inputs.place)
+
+
+class _MindView:
+    """
+    The slice of the mind bots read: memory size, lexicon, cry, place.
+    """
+    __slots__ = ("memory", "lexicon", "schedule")
+
+    def __init__(self, inputs: TickInputs):
+        self.memory = range(inputs.memory_size)   # only len() is used
+        self.lexicon = inputs.lexicon
+        self.schedule = _Schedule(inputs)
+
+
+class ProposalRecorder:
+    """
+    Stands in for the registry while a bot runs; keeps its proposals
+    in call order so they can be merged afterwards.
+    """
+
+    def __init__(self):
+        self.proposals: List[Dict[str, Any]] = []
+
+    def propose(self, **kwargs) -> None:
+        self.proposals.append(kwargs)
+
+
+def _run_bot(fn: BotFn, inputs: TickInputs) -> Tuple[List[Dict[str, Any]], float, Optional[str]]:
+    rec = ProposalRecorder()
+    t0 = time.perf_counter()
+    error = None
+    try:
+        fn(rec, _WorldView(inputs), _ProfilesView(inputs), _MindView(inputs))
+    except Exception as e:   # one bad bot must not sink the tick
+        error = f"{type(e).__name__}: {e}"
+        rec.proposals.clear()
+    return rec.proposals, time.perf_counter() - t0, error
+
+
+# =========================
+# Scheduler
+# =========================
+
+@dataclass
+class BotStats:
+    calls: int = 0
+    proposals: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    last_seconds: float = 0.0
+    max_seconds: float = 0.0
+    last_error: Optional[str] = None
+
+    def record(self, seconds: float, n: int, error: Optional[str]):
+        self.calls += 1
+        self.proposals += n
+        self.seconds += seconds
+        self.last_seconds = seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        if error:
+            self.errors += 1
+            self.last_error = error
+
+
+@dataclass
+class BotScheduler:
+    """
+    Runs registered curriculum bots once per tick.
+
+    The read-only inputs are snapshotted once (TickInputs.capture), every
+    bot runs against that snapshot in a thread pool (or a process pool,
+    or serially), and the collected proposals are merged into the
+    registry in registration order, so the result does not depend on
+    which bot finishes first.
+    """
+    registry: FuturePathRegistry
+    mode: str = "thread"            # thread | process | serial
+    max_workers: Optional[int] = None
+    bots: Dict[str, BotFn] = field(default_factory=dict)
+    stats: Dict[str, BotStats] = field(default_factory=dict)
+    ticks: int = 0
+    _pool: Optional[Executor] = field(default=None, repr=False)
+
+    def register(self, name: str, fn: BotFn, pass_name: bool = False):
+        """
+        Register a bot. With pass_name the bot is called as
+        fn(name, registry, world, profiles, mind), like bot.propose_paths.
+        Bots run in the process pool must be module-level functions.
+        """
+        self.bots[name] = partial(fn, name) if pass_name else fn
+        self.stats.setdefault(name, BotStats())
+
+    def unregister(self, name: str):
+        self.bots.pop(name, None)
+        self.stats.pop(name, None)
+
+    def _executor(self) -> Optional[Executor]:
+        if self.mode == "serial":
+            return None
+        if self._pool is None:
+            cls = ProcessPoolExecutor if self.mode == "process" else ThreadPoolExecutor
+            self._pool = cls(max_workers=self.max_workers)
+        return self._pool
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def tick(self, world, profiles, mind) -> List[str]:
+        """
+        Run every bot once; returns the path ids proposed this tick
+        (in merge order; dedupe may repeat an existing id).
+        """
+        inputs = TickInputs.capture(world, profiles, mind)
+        names = list(self.bots)
+        pool = self._executor()
+
+        if pool is None:
+            results = [_run_bot(self.bots[n], inputs) for n in names]
+        else:
+            futures = [pool.submit(_run_bot, self.bots[n], inputs) for n in names]
+            results = [f.result() for f in futures]
+
+        path_ids: List[str] = []
+        for name, (proposals, seconds, error) in zip(names, results):
+            self.stats[name].record(seconds, len(proposals), error)
+            for kwargs in proposals:
+                path_ids.append(self.registry.propose(**kwargs))
+
+        self.ticks += 1
+        return path_ids
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-bot latency and output, slowest (by mean) first.
+        """
+        out = {}
+        for name, s in self.stats.items():
+            out[name] = {
+                "calls": s.calls,
+                "proposals": s.proposals,
+                "errors": s.errors,
+                "mean_ms": round(1e3 * s.seconds / s.calls, 3) if s.calls else 0.0,
+                "last_ms": round(1e3 * s.last_seconds, 3),
+                "max_ms": round(1e3 * s.max_seconds, 3),
+                "last_error": s.last_error,
+            }
+        return dict(sorted(out.items(), key=lambda kv: -kv[1]["mean_ms"]))
+
+
+def default_scheduler(registry: FuturePathRegistry, mode: str = "thread") -> BotScheduler:
+    """
+    Scheduler with the built-in bots registered.
+    """
+    from a7do import bot, boy, neighbour_bot
+
+    sched = BotScheduler(registry, mode=mode)
+    sched.register("bot", bot.propose_paths, pass_name=True)
+    sched.register("boy", boy.propose_paths, pass_name=True)
+    sched.register("neighbour", neighbour_bot.propose_neighbour_visit)
+    return sched
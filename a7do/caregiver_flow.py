@@ -1,6 +1,6 @@
 # a7do/caregiver_flow.py
 
-from typing import List
+from typing import Iterator, List
 from a7do.events import ExperienceEvent
 
 
@@ -9,62 +9,56 @@ class CaregiverFlow:
         self.start_place = start_place
 
     def build_day(self, day: int, n_events: int = 10) -> List[ExperienceEvent]:
-        events: List[ExperienceEvent] = []
+        return list(self.iter_day(day, n_events))
 
+    def iter_day(self, day: int, n_events: int = 10) -> Iterator[ExperienceEvent]:
+        """
+        Yield the day's events one at a time, built on demand.
+        """
         for i in range(n_events):
             # --- Birth: ALWAYS day 0, event 0 ---
             if day == 0 and i == 0:
-                events.append(
-                    ExperienceEvent(
-                        day=0,
-                        index=0,
-                        kind="birth",
-                        place="hospital",
-                        people_present=["Mum", "Dad"],
-                        notes="A7DO birth event",
-                    )
+                yield ExperienceEvent(
+                    day=0,
+                    index=0,
+                    kind="birth",
+                    place="hospital",
+                    people_present=["Mum", "Dad"],
+                    notes="A7DO birth event",
                 )
                 continue
 
             # --- Journey home ---
             if day == 0 and i == n_events // 2:
-                events.append(
-                    ExperienceEvent(
-                        day=day,
-                        index=i,
-                        kind="travel",
-                        place="home",
-                        people_present=["Mum", "Dad"],
-                        transport={"type": "car"},
-                        notes="Journey home from hospital",
-                    )
+                yield ExperienceEvent(
+                    day=day,
+                    index=i,
+                    kind="travel",
+                    place="home",
+                    people_present=["Mum", "Dad"],
+                    transport={"type": "car"},
+                    notes="Journey home from hospital",
                 )
                 continue
 
             # --- Sleep ---
             if i == n_events - 1:
-                events.append(
-                    ExperienceEvent(
-                        day=day,
-                        index=i,
-                        kind="sleep",
-                        place="bedroom",
-                        people_present=["Mum", "Dad"],
-                        notes="Sleep",
-                    )
-                )
-                continue
-
-            # --- Default care ---
-            events.append(
-                ExperienceEvent(
+                yield ExperienceEvent(
                     day=day,
                     index=i,
-                    kind="care",
-                    place="hospital" if day == 0 else "home",
+                    kind="sleep",
+                    place="bedroom",
                     people_present=["Mum", "Dad"],
-                    notes="Routine care",
+                    notes="Sleep",
                 )
-            )
+                continue
 
-        return events
\ No newline at end of file
+            # --- Default care ---
+            yield ExperienceEvent(
+                day=day,
+                index=i,
+                kind="care",
+                place="hospital" if day == 0 else "home",
+                people_present=["Mum", "Dad"],
+                notes="Routine care",
+            )
\ No newline at end of file
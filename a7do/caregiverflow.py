@@ -1,7 +1,7 @@
 # a7do/caregiver_flow.py
 from __future__ import annotations
 
-from typing import List
+from typing import Iterator, List
 from a7do.events import ExperienceEvent
 from a7do.world import WorldState, tick_bot_routines
 
@@ -23,35 +23,38 @@ class CaregiverFlow:
         """
         Build the ordered list of ExperienceEvent objects for a given day.
         """
+        return list(self.iter_day(day_index, n_events))
+
+    def iter_day(self, day_index: int, n_events: int = 10) -> Iterator[ExperienceEvent]:
+        """
+        Yield the day's events in order, each built only when requested.
+        Bot routines advance when the first event is pulled.
+        """
         if day_index == 0:
-            return self._build_birth_day()
+            yield from self._build_birth_day()
+            return
 
         # Advance background bot routines (observer-only)
         tick_bot_routines(self.world, day_index)
 
-        events: List[ExperienceEvent] = []
         idx = 0
 
         # Morning wake (always at home after day 0)
-        events.append(self._wake_event(day_index, idx))
+        yield self._wake_event(day_index, idx)
         idx += 1
 
         # Day activities (caregiver-driven)
-        activities = self._day_activities(day_index, n_events - 3)
-
-        for act in activities:
+        for act in self._iter_day_activities(day_index, n_events - 3):
             act.index = idx
-            events.append(act)
+            yield act
             idx += 1
 
         # Return home
-        events.append(self._return_home_event(day_index, idx))
+        yield self._return_home_event(day_index, idx)
         idx += 1
 
         # Bedtime & sleep
-        events.append(self._sleep_event(day_index, idx))
-
-        return events
+        yield self._sleep_event(day_index, idx)
 
     # =========================
     # DAY 0 — BIRTH
@@ -147,8 +150,9 @@ class CaregiverFlow:
         """
         Build caregiver-led daytime activities.
         """
-        activities: List[ExperienceEvent] = []
+        return list(self._iter_day_activities(day, count))
 
+    def _iter_day_activities(self, day: int, count: int) -> Iterator[ExperienceEvent]:
         # Simple deterministic rotation for now
         options = ["park", "shops", "home"]
 
@@ -165,21 +169,17 @@ class CaregiverFlow:
                 pets.append("Millie")
                 sounds.extend(["Lucy", "Millie"])
 
-            activities.append(
-                ExperienceEvent(
-                    day=day,
-                    index=0,  # filled later
-                    place=place,
-                    people_present=people,
-                    pets_present=pets,
-                    sensory=self.world.get_sensory(place),
-                    sounds=sounds,
-                    note=f"Day activity at {place}",
-                )
+            yield ExperienceEvent(
+                day=day,
+                index=0,  # filled later
+                place=place,
+                people_present=people,
+                pets_present=pets,
+                sensory=self.world.get_sensory(place),
+                sounds=sounds,
+                note=f"Day activity at {place}",
             )
 
-        return activities
-
     def _return_home_event(self, day: int, idx: int) -> ExperienceEvent:
         return ExperienceEvent(
             day=day,
@@ -0,0 +1,269 @@
+# a7do/columnar.py
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class _Column:
+    """
+    One chunked, typed column.
+
+    kinds:
+      "q" ints          -> array('q')
+      "d" floats        -> array('d')
+      "s" strings/None  -> interned ids in array('l'), -1 = None
+      "t" list of str   -> shared tuples of interned ids
+      "o" anything else -> plain list
+    A value that does not fit the column's kind promotes it to "o".
+    Rows before `start` (column created later) have no value.
+    """
+
+    def __init__(self, kind: str, start: int, chunk_size: int):
+        self.kind = kind
+        self.start = start
+        self.chunk_size = chunk_size
+        self.chunks: List[Any] = []
+        self.n = 0
+
+    def _new_chunk(self):
+        if self.kind in ("q", "d"):
+            return array(self.kind)
+        if self.kind == "s":
+            return array("l")
+        return []
+
+    def push(self, stored: Any):
+        if self.n % self.chunk_size == 0:
+            self.chunks.append(self._new_chunk())
+        self.chunks[-1].append(stored)
+        self.n += 1
+
+    def pad_to(self, row: int, filler: Any):
+        while self.start + self.n < row:
+            self.push(filler)
+
+    def raw(self, row: int) -> Any:
+        i = row - self.start
+        return self.chunks[i // self.chunk_size][i % self.chunk_size]
+
+
+def _kind_of(value: Any) -> str:
+    if value is None or isinstance(value, str):
+        return "s"
+    if isinstance(value, bool):
+        return "o"
+    if isinstance(value, int):
+        return "q"
+    if isinstance(value, float):
+        return "d"
+    if isinstance(value, list) and all(isinstance(v, str) for v in value):
+        return "t"
+    return "o"
+
+
+class ColumnarLog:
+    """
+    Append-only columnar store for dict-shaped log rows.
+
+    Each distinct key set ("shape") is stored once; each key gets its own
+    typed, chunked column. Strings are interned. Rows read back as fresh
+    dicts equal to what was appended (string lists come back as new lists).
+    Columns named in `index_on` keep a value -> row-ids index, so
+    filtering by e.g. kind or day touches only matching rows.
+    """
+
+    def __init__(self, index_on: Iterable[str] = (), chunk_size: int = 4096):
+        self.chunk_size = chunk_size
+
+        self._ids: Dict[str, int] = {}
+        self._strings: List[str] = []
+        self._tuples: Dict[tuple, tuple] = {}
+
+        self._shapes: List[Tuple[str, ...]] = []
+        self._shape_ids: Dict[Tuple[str, ...], int] = {}
+        self._row_shape = _Column("q", 0, chunk_size)
+
+        self._cols: Dict[str, _Column] = {}
+        self._index: Dict[str, Dict[Any, array]] = {k: {} for k in index_on}
+        self._n = 0
+
+    # =========================
+    # Interning
+    # =========================
+
+    def _intern(self, s: str) -> int:
+        i = self._ids.get(s)
+        if i is None:
+            i = len(self._strings)
+            self._ids[s] = i
+            self._strings.append(s)
+        return i
+
+    def _store(self, col: _Column, value: Any) -> Any:
+        if col.kind == "s":
+            return -1 if value is None else self._intern(value)
+        if col.kind == "t":
+            t = tuple(self._intern(v) for v in value)
+            return self._tuples.setdefault(t, t)
+        return value
+
+    def _load(self, col: _Column, stored: Any) -> Any:
+        if col.kind == "s":
+            return None if stored < 0 else self._strings[stored]
+        if col.kind == "t":
+            return [self._strings[i] for i in stored]
+        return stored
+
+    def _promote(self, col: _Column):
+        """
+        Re-store a column as plain objects.
+        """
+        values = [self._load(col, v) for chunk in col.chunks for v in chunk]
+        col.kind = "o"
+        col.chunks = [values[i:i + col.chunk_size] for i in range(0, len(values), col.chunk_size)]
+
+    # =========================
+    # Writing
+    # =========================
+
+    def append(self, row: Optional[Dict[str, Any]] = None, **fields):
+        """
+        Append one row, given as a dict and/or keyword fields.
+        """
+        if row is None:
+            row = fields
+        elif fields:
+            row = {**row, **fields}
+
+        shape = tuple(row)
+        sid = self._shape_ids.get(shape)
+        if sid is None:
+            sid = len(self._shapes)
+            self._shape_ids[shape] = sid
+            self._shapes.append(shape)
+        self._row_shape.push(sid)
+
+        n = self._n
+        for key, value in row.items():
+            col = self._cols.get(key)
+            if col is None:
+                col = self._cols[key] = _Column(_kind_of(value), n, self.chunk_size)
+            elif col.kind != "o" and _kind_of(value) != col.kind:
+                self._promote(col)
+            if col.start + col.n < n:
+                col.pad_to(n, None if col.kind == "o" else self._store(col, self._filler(col)))
+            col.push(self._store(col, value))
+
+            idx = self._index.get(key)
+            if idx is not None:
+                ids = idx.get(value)
+                if ids is None:
+                    ids = idx[value] = array("q")
+                ids.append(n)
+
+        self._n = n + 1
+
+    def append_many(self, rows: Iterable[Dict[str, Any]]):
+        for row in rows:
+            self.append(row)
+
+    @staticmethod
+    def _filler(col: _Column) -> Any:
+        return {"q": 0, "d": 0.0, "s": None, "t": ()}[col.kind]
+
+    # =========================
+    # Reading
+    # =========================
+
+    def __len__(self) -> int:
+        return self._n
+
+    def row(self, i: int) -> Dict[str, Any]:
+        shape = self._shapes[self._row_shape.raw(i)]
+        out = {}
+        for key in shape:
+            col = self._cols[key]
+            out[key] = self._load(col, col.raw(i))
+        return out
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self.row(i) for i in range(*key.indices(self._n))]
+        if key < 0:
+            key += self._n
+        if not 0 <= key < self._n:
+            raise IndexError("log index out of range")
+        return self.row(key)
+
+    def __iter__(self):
+        for i in range(self._n):
+            yield self.row(i)
+
+    def rows(self, ids: Iterable[int]) -> List[Dict[str, Any]]:
+        return [self.row(i) for i in ids]
+
+    def row_ids(self, **where) -> List[int]:
+        """
+        Row ids matching every key=value given. Indexed keys are looked up
+        directly; other keys are checked only on the candidate rows.
+        """
+        candidates: Optional[List[int]] = None
+        rest = {}
+        for key, value in where.items():
+            idx = self._index.get(key)
+            if idx is None:
+                rest[key] = value
+                continue
+            ids = idx.get(value, ())
+            if candidates is None:
+                candidates = list(ids)
+            else:
+                keep = set(ids)
+                candidates = [i for i in candidates if i in keep]
+
+        if candidates is None:
+            candidates = range(self._n)
+        if not rest:
+            return list(candidates)
+
+        out = []
+        for i in candidates:
+            shape = self._shapes[self._row_shape.raw(i)]
+            if all(k in shape and self._load(self._cols[k], self._cols[k].raw(i)) == v for k, v in rest.items()):
+                out.append(i)
+        return out
+
+    def filter(self, **where) -> List[Dict[str, Any]]:
+        return self.rows(self.row_ids(**where))
+
+    def count(self, **where) -> int:
+        if len(where) == 1:
+            (key, value), = where.items()
+            idx = self._index.get(key)
+            if idx is not None:
+                return len(idx.get(value, ()))
+        return len(self.row_ids(**where))
+
+    def column(self, key: str, ids: Optional[Iterable[int]] = None) -> List[Any]:
+        """
+        Values of one column (None where a row lacks the key).
+        """
+        col = self._cols.get(key)
+        rng = range(self._n) if ids is None else ids
+        if col is None:
+            return [None for _ in rng]
+        out = []
+        for i in rng:
+            if key in self._shapes[self._row_shape.raw(i)]:
+                out.append(self._load(col, col.raw(i)))
+            else:
+                out.append(None)
+        return out
+
+    def to_columns(self, ids: Optional[Iterable[int]] = None) -> Dict[str, List[Any]]:
+        """
+        Column-oriented export (e.g. for an observer table).
+        """
+        ids = list(range(self._n)) if ids is None else list(ids)
+        return {key: self.column(key, ids) for key in self._cols}
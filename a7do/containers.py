@@ -0,0 +1,61 @@
+# a7do/containers.py
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict, List
+
+
+# =========================
+# Read-only
+# =========================
+
+def _frozen(*_args, **_kwargs):
+    raise TypeError("read-only container; copy it (list(x) / dict(x)) to modify")
+
+
+class FrozenList(list):
+    """
+    Read-only list. Copies (copy, deepcopy, asdict) are plain lists.
+    """
+
+    __slots__ = ()
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _frozen
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _frozen
+
+    def __copy__(self) -> List[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo) -> List[Any]:
+        return copy.deepcopy(list(self), memo)
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict. Copies (copy, deepcopy, asdict) are plain dicts.
+    """
+
+    __slots__ = ()
+
+    pop = popitem = clear = update = setdefault = _frozen
+    __setitem__ = __delitem__ = __ior__ = _frozen
+
+    def copy(self) -> Dict[Any, Any]:
+        return dict(self)
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo) -> Dict[Any, Any]:
+        return copy.deepcopy(dict(self), memo)
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def __hash__(self):
+        return hash(tuple(sorted(self.items())))
@@ -0,0 +1,125 @@
+# a7do/cooccurrence.py
+from __future__ import annotations
+
+import heapq
+from array import array
+from typing import Dict, List, Tuple
+
+
+class CooccurrenceGraph:
+    """
+    Persistent, incrementally updated co-occurrence graph.
+
+    Nodes are interned label strings ("agent:Mum", "place:park_01", ...).
+    Edges are directed (a, b) pairs held in parallel arrays
+    (src, dst, weight) with a per-node adjacency map into them.
+
+    Decay is applied lazily through a global scale factor, so decaying
+    every edge is O(1). A heap of (-weight, edge) entries is kept up to
+    date on every bump; stale entries are skipped and the heap is rebuilt
+    when it grows too far past the edge count.
+    """
+
+    # Renormalise stored weights once the global scale gets this small
+    _MIN_SCALE = 1e-150
+
+    def __init__(self):
+        self._node_ids: Dict[str, int] = {}
+        self.nodes: List[str] = []
+
+        self.src = array("l")
+        self.dst = array("l")
+        self._w = array("d")                    # stored weight; true weight = stored * scale
+        self._adj: List[Dict[int, int]] = []    # node -> {neighbour: edge id}
+
+        self._scale = 1.0
+        self._heap: List[Tuple[float, int]] = []
+
+    # =========================
+    # Nodes / edges
+    # =========================
+
+    def node(self, label: str) -> int:
+        nid = self._node_ids.get(label)
+        if nid is None:
+            nid = len(self.nodes)
+            self._node_ids[label] = nid
+            self.nodes.append(label)
+            self._adj.append({})
+        return nid
+
+    def add(self, a: str, b: str, w: float = 1.0):
+        ia, ib = self.node(a), self.node(b)
+        eid = self._adj[ia].get(ib)
+        if eid is None:
+            eid = len(self._w)
+            self._adj[ia][ib] = eid
+            self.src.append(ia)
+            self.dst.append(ib)
+            self._w.append(0.0)
+        self._w[eid] += w / self._scale
+        heapq.heappush(self._heap, (-self._w[eid], eid))
+
+        if len(self._heap) > 4 * len(self._w) + 64:
+            self._rebuild_heap()
+
+    def weight(self, a: str, b: str) -> float:
+        ia, ib = self._node_ids.get(a), self._node_ids.get(b)
+        if ia is None or ib is None:
+            return 0.0
+        eid = self._adj[ia].get(ib)
+        return 0.0 if eid is None else self._w[eid] * self._scale
+
+    def neighbours(self, label: str) -> Dict[str, float]:
+        nid = self._node_ids.get(label)
+        if nid is None:
+            return {}
+        return {self.nodes[j]: self._w[e] * self._scale for j, e in self._adj[nid].items()}
+
+    def __len__(self) -> int:
+        return len(self._w)
+
+    # =========================
+    # Decay
+    # =========================
+
+    def decay(self, factor: float):
+        """
+        Multiply every edge weight by `factor` (O(1)).
+        """
+        self._scale *= factor
+        if self._scale < self._MIN_SCALE:
+            w = self._w
+            for i in range(len(w)):
+                w[i] *= self._scale
+            self._scale = 1.0
+            self._rebuild_heap()
+
+    # =========================
+    # Top edges
+    # =========================
+
+    def _rebuild_heap(self):
+        self._heap = [(-w, eid) for eid, w in enumerate(self._w)]
+        heapq.heapify(self._heap)
+
+    def top(self, k: int = 20) -> List[Tuple[str, str, float]]:
+        """
+        Heaviest k edges; ties keep first-seen order.
+        """
+        heap = self._heap
+        found: List[Tuple[float, int]] = []
+        seen = set()
+        while heap and len(found) < k:
+            neg_w, eid = heapq.heappop(heap)
+            if eid in seen or -neg_w != self._w[eid]:
+                continue  # stale entry
+            seen.add(eid)
+            found.append((neg_w, eid))
+        for entry in found:
+            heapq.heappush(heap, entry)
+
+        return [
+            (self.nodes[self.src[eid]], self.nodes[self.dst[eid]], -neg_w * self._scale)
+            for neg_w, eid in found
+        ]
@@ -0,0 +1,46 @@
+# a7do/day_series.py
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Optional
+
+
+class DaySeries:
+    """
+    Per-day totals kept as running (prefix) sums, days ascending.
+    Any [start_day, end_day] total is two bisects.
+    """
+
+    __slots__ = ("days", "cum")
+
+    def __init__(self):
+        self.days = array("l")
+        self.cum = array("d")
+
+    def add(self, day: int, amount: float):
+        if self.days and self.days[-1] == day:
+            self.cum[-1] += amount
+            return
+        if self.days and day < self.days[-1]:
+            # Out-of-order day: rebuild from here (rare; schedules run forward)
+            i = bisect_right(self.days, day)
+            if i and self.days[i - 1] == day:
+                for j in range(i - 1, len(self.cum)):
+                    self.cum[j] += amount
+                return
+            prev = self.cum[i - 1] if i else 0.0
+            self.days.insert(i, day)
+            self.cum.insert(i, prev + amount)
+            for j in range(i + 1, len(self.cum)):
+                self.cum[j] += amount
+            return
+        self.days.append(day)
+        self.cum.append((self.cum[-1] if self.cum else 0.0) + amount)
+
+    def total(self, start_day: Optional[int] = None, end_day: Optional[int] = None) -> float:
+        lo = 0 if start_day is None else bisect_left(self.days, start_day)
+        hi = len(self.days) if end_day is None else bisect_right(self.days, end_day)
+        if hi <= lo:
+            return 0.0
+        return self.cum[hi - 1] - (self.cum[lo - 1] if lo else 0.0)
@@ -0,0 +1,378 @@
+# a7do/event_store.py
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import weakref
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+MAGIC = b"A7EVLOG1"
+HEADER = struct.Struct("<8sQ")              # magic, records in segment
+RECORD = struct.Struct("<iiIIIB3x")         # day, index, kind, place, notes, notes_is_json
+RECORD_DTYPE = np.dtype({
+    "names": ["day", "index"],
+    "formats": ["<i4", "<i4"],
+    "offsets": [0, 4],
+    "itemsize": RECORD.size,
+})
+NONE = 0xFFFFFFFF
+
+
+class _Segment:
+    __slots__ = ("mm", "fh", "capacity", "count")
+
+    def __init__(self, mm: mmap.mmap, fh, capacity: int, count: int):
+        self.mm = mm
+        self.fh = fh
+        self.capacity = capacity
+        self.count = count
+
+
+# Roots held by an open EventLog in this process (one writer per root)
+_OPEN_ROOTS: Set[str] = set()
+
+
+def _release(handles: List[Any], key: Optional[str]):
+    # maps before the files under them
+    for h in reversed(handles):
+        h.close()
+    handles.clear()
+    _OPEN_ROOTS.discard(key)
+
+
+class EventLog:
+    """
+    Observer event history as fixed-width records in memory-mapped
+    segment files, so long simulations stay off the Python heap.
+
+        <root>/strings.jsonl      interned kind / place / notes, one per line
+        <root>/seg_000000.evl     header (magic, count) + 24-byte records
+
+    Appends are O(1) writes into the current segment; a new segment is
+    created when it fills. Records come back as the dicts the old list
+    held ({"day", "index", "kind", "place", "notes"}), by position or by
+    (day, index). Reopening the same root resumes the log. With no root
+    the segments are anonymous maps (still off-heap, not persisted).
+
+    The log owns its maps and file handles: close() (or a with block)
+    releases them, and a finalizer does so if the log is dropped unclosed.
+    A closed log refuses further use. Only one open log per root is
+    allowed in a process; opening a root that is already open raises
+    ValueError. A pickled rooted log is a handle to its directory and
+    reopens it on load (so it cannot be unpickled while the original is
+    still open); an anonymous log pickles its records. deepcopy gives a
+    detached anonymous copy, so two logs never write to the same files.
+    """
+
+    def __init__(self, root: Optional[str] = None, segment_size: int = 65536):
+        self.root = root
+        self.segment_size = segment_size
+
+        self.strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        self._strings_fh = None
+
+        self._segments: List[_Segment] = []
+        self._count = 0
+        # day -> runs of consecutive positions: [start, end, index at start]
+        self._runs: Dict[int, List[List[int]]] = {}
+        self._closed = False
+
+        key = None
+        if root is not None:
+            key = os.path.realpath(root)
+            if key in _OPEN_ROOTS:
+                raise ValueError(f"event log at {root} is already open in this process")
+            os.makedirs(root, exist_ok=True)
+            _OPEN_ROOTS.add(key)
+        self._handles: List[Any] = []   # every open map / file, for close()
+        self._finalizer = weakref.finalize(self, _release, self._handles, key)
+
+        if root is not None:
+            try:
+                self._resume()
+            except Exception:
+                self._finalizer()
+                raise
+
+    # =========================
+    # Files
+    # =========================
+
+    def _seg_path(self, seg: int) -> str:
+        return os.path.join(self.root, f"seg_{seg:06d}.evl")
+
+    def _strings_path(self) -> str:
+        return os.path.join(self.root, "strings.jsonl")
+
+    def _resume(self):
+        if os.path.exists(self._strings_path()):
+            with open(self._strings_path(), encoding="utf-8") as fh:
+                for line in fh:
+                    if line.strip():
+                        s = json.loads(line)
+                        self._string_ids[s] = len(self.strings)
+                        self.strings.append(s)
+
+        seg = 0
+        while os.path.exists(self._seg_path(seg)):
+            fh = open(self._seg_path(seg), "r+b")
+            mm = mmap.mmap(fh.fileno(), 0)
+            self._handles += (fh, mm)
+            magic, count = HEADER.unpack_from(mm, 0)
+            if magic != MAGIC:
+                raise ValueError(f"not an event log segment: {self._seg_path(seg)}")
+            capacity = (len(mm) - HEADER.size) // RECORD.size
+            self.segment_size = capacity   # keep new segments the same size
+            self._segments.append(_Segment(mm, fh, capacity, count))
+            self._index_segment(self._count, mm, count)
+            self._count += count
+            seg += 1
+
+    def _index_segment(self, base: int, mm: mmap.mmap, count: int):
+        """
+        Rebuild day runs for a reopened segment from its day/index columns.
+        """
+        if not count:
+            return
+        cols = np.frombuffer(mm, dtype=RECORD_DTYPE, count=count, offset=HEADER.size)
+        days = cols["day"]
+        cuts = np.flatnonzero(np.diff(days)) + 1
+        starts = np.concatenate(([0], cuts))
+        ends = np.concatenate((cuts, [count]))
+        for s, e in zip(starts.tolist(), ends.tolist()):
+            self._add_run(int(days[s]), base + s, base + e, int(cols["index"][s]))
+        del cols, days
+
+    def _new_segment(self) -> _Segment:
+        size = HEADER.size + self.segment_size * RECORD.size
+        if self.root is None:
+            fh = None
+            mm = mmap.mmap(-1, size)
+        else:
+            path = self._seg_path(len(self._segments))
+            fh = open(path, "x+b")   # never truncate an existing segment
+            fh.truncate(size)
+            mm = mmap.mmap(fh.fileno(), size)
+            self._handles.append(fh)
+        self._handles.append(mm)
+        HEADER.pack_into(mm, 0, MAGIC, 0)
+        seg = _Segment(mm, fh, self.segment_size, 0)
+        self._segments.append(seg)
+        return seg
+
+    def _sid(self, s: str) -> int:
+        i = self._string_ids.get(s)
+        if i is None:
+            i = self._string_ids[s] = len(self.strings)
+            self.strings.append(s)
+            if self.root is not None:
+                if self._strings_fh is None:
+                    self._strings_fh = open(self._strings_path(), "a", encoding="utf-8")
+                    self._handles.append(self._strings_fh)
+                # strings hit disk before any record that refers to them
+                self._strings_fh.write(json.dumps(s) + "\n")
+                self._strings_fh.flush()
+        return i
+
+    def _add_run(self, day: int, start: int, end: int, first_index: int):
+        runs = self._runs.setdefault(day, [])
+        if runs and runs[-1][1] == start:
+            runs[-1][1] = end
+        else:
+            runs.append([start, end, first_index])
+
+    # =========================
+    # Writing
+    # =========================
+
+    def _pack(self, seg: _Segment, rec: Dict[str, Any]):
+        kind, place, notes = rec.get("kind"), rec.get("place"), rec.get("notes")
+        as_json = notes is not None and not isinstance(notes, str)
+        RECORD.pack_into(
+            seg.mm,
+            HEADER.size + seg.count * RECORD.size,
+            rec["day"],
+            rec["index"],
+            NONE if kind is None else self._sid(kind),
+            NONE if place is None else self._sid(place),
+            NONE if notes is None else self._sid(json.dumps(notes) if as_json else notes),
+            as_json,
+        )
+        seg.count += 1
+        self._add_run(rec["day"], self._count, self._count + 1, rec["index"])
+        self._count += 1
+
+    def append(self, rec: Dict[str, Any]):
+        """
+        Append one {"day", "index", "kind", "place", "notes"} record.
+        """
+        self._check_open()
+        seg = self._segments[-1] if self._segments else None
+        if seg is None or seg.count == seg.capacity:
+            seg = self._new_segment()
+        self._pack(seg, rec)
+        HEADER.pack_into(seg.mm, 0, MAGIC, seg.count)
+
+    def extend(self, recs: Iterable[Dict[str, Any]]):
+        """
+        Bulk append; each touched segment's header is written once.
+        """
+        self._check_open()
+        seg = self._segments[-1] if self._segments else None
+        for rec in recs:
+            if seg is None or seg.count == seg.capacity:
+                if seg is not None:
+                    HEADER.pack_into(seg.mm, 0, MAGIC, seg.count)
+                seg = self._new_segment()
+            self._pack(seg, rec)
+        if seg is not None:
+            HEADER.pack_into(seg.mm, 0, MAGIC, seg.count)
+
+    def flush(self):
+        for seg in self._segments:
+            seg.mm.flush()
+        if self._strings_fh is not None:
+            self._strings_fh.flush()
+
+    def close(self):
+        """
+        Flush and release the files. The log cannot be used afterwards;
+        open the root again to continue it.
+        """
+        if self._closed:
+            return
+        self.flush()
+        self._finalizer()
+        self._segments = []
+        self._strings_fh = None
+        self._closed = True
+
+    def _check_open(self):
+        if self._closed:
+            raise ValueError("event log is closed")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # =========================
+    # Copying / pickling
+    # =========================
+
+    def _raw(self) -> bytes:
+        self._check_open()
+        return b"".join(
+            seg.mm[HEADER.size:HEADER.size + seg.count * RECORD.size] for seg in self._segments
+        )
+
+    def _load(self, strings: List[str], raw: bytes):
+        """
+        Fill an empty anonymous log from interned strings + packed records.
+        """
+        self.strings = list(strings)
+        self._string_ids = {s: i for i, s in enumerate(self.strings)}
+        step = self.segment_size * RECORD.size
+        for lo in range(0, len(raw), step):
+            chunk = raw[lo:lo + step]
+            seg = self._new_segment()
+            seg.mm[HEADER.size:HEADER.size + len(chunk)] = chunk
+            seg.count = len(chunk) // RECORD.size
+            HEADER.pack_into(seg.mm, 0, MAGIC, seg.count)
+            self._index_segment(self._count, seg.mm, seg.count)
+            self._count += seg.count
+
+    def __getstate__(self):
+        self.flush()
+        if self.root is not None:
+            return {"root": self.root, "segment_size": self.segment_size, "count": self._count}
+        return {"root": None, "segment_size": self.segment_size, "strings": self.strings, "records": self._raw()}
+
+    def __setstate__(self, state):
+        self.__init__(state["root"], state["segment_size"])
+        if self.root is None:
+            self._load(state["strings"], state["records"])
+        elif self._count < state["count"]:
+            n = self._count
+            self.close()
+            raise ValueError(f"event log at {self.root} has {n} records, expected at least {state['count']}")
+
+    def __deepcopy__(self, memo) -> "EventLog":
+        self.flush()
+        out = EventLog(None, self.segment_size)
+        out._load(self.strings, self._raw())
+        memo[id(self)] = out
+        return out
+
+    # =========================
+    # Reading
+    # =========================
+
+    def _locate(self, pos: int) -> Tuple[_Segment, int]:
+        self._check_open()
+        # all segments but the last are full, and share one capacity
+        cap = self._segments[0].capacity
+        seg, off = divmod(pos, cap)
+        return self._segments[seg], HEADER.size + off * RECORD.size
+
+    def _index_at(self, pos: int) -> int:
+        seg, off = self._locate(pos)
+        return struct.unpack_from("<i", seg.mm, off + 4)[0]
+
+    def _decode(self, pos: int) -> Dict[str, Any]:
+        seg, off = self._locate(pos)
+        day, index, kind, place, notes, as_json = RECORD.unpack_from(seg.mm, off)
+        text = None if notes == NONE else self.strings[notes]
+        return {
+            "day": day,
+            "index": index,
+            "kind": None if kind == NONE else self.strings[kind],
+            "place": None if place == NONE else self.strings[place],
+            "notes": json.loads(text) if as_json else text,
+        }
+
+    def position(self, day: int, index: int) -> Optional[int]:
+        """
+        Log position of the (day, index) event, or None.
+        """
+        for start, end, first in self._runs.get(day, ()):
+            guess = start + index - first
+            if start <= guess < end and self._index_at(guess) == index:
+                return guess
+            for pos in range(start, end):
+                if self._index_at(pos) == index:
+                    return pos
+        return None
+
+    def get(self, day: int, index: int) -> Optional[Dict[str, Any]]:
+        pos = self.position(day, index)
+        return None if pos is None else self._decode(pos)
+
+    def day_records(self, day: int) -> List[Dict[str, Any]]:
+        return [self._decode(p) for start, end, _ in self._runs.get(day, ()) for p in range(start, end)]
+
+    def days(self) -> List[int]:
+        return sorted(self._runs)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._decode(i) for i in range(*key.indices(self._count))]
+        if key < 0:
+            key += self._count
+        if not 0 <= key < self._count:
+            raise IndexError("event log index out of range")
+        return self._decode(key)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(self._count):
+            yield self._decode(i)
@@ -6,12 +6,19 @@ from typing import List, Dict, Optional
 class ExperienceEvent:
     day: int
     index: int
-    kind: str          # birth, care, travel, sleep
-    place: str         # hospital, home, bedroom
+    kind: str = "experience"   # birth, care, travel, sleep
+    place: str = ""            # hospital, home, bedroom
     people_present: List[str] = field(default_factory=list)
 
     movement: Optional[Dict] = None
     transport: Optional[Dict] = None
     sensory: Dict[str, List[str]] = field(default_factory=dict)
 
-    notes: str = ""
\ No newline at end of file
+    notes: str = ""
+
+    # Observer-side routine fields (NewbornRoutine / CaregiverFlow)
+    pets_present: List[str] = field(default_factory=list)
+    sounds: List[str] = field(default_factory=list)
+    body_effects: Dict[str, str] = field(default_factory=dict)
+    note: str = ""
+    timestamp: Optional[float] = None   # simulated seconds since the day's midnight
@@ -1,10 +1,15 @@
 # a7do/future_paths.py
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
+import heapq
+import json
 import uuid
 import time
 
 
+STATUSES = ("proposed", "approved", "scheduled", "experienced")
+
+
 @dataclass
 class FuturePath:
     path_id: str
@@ -18,9 +23,72 @@ class FuturePath:
     notes: List[str] = field(default_factory=list)
 
 
+def content_key(type: str, proposal: Dict[str, Any]) -> str:
+    """
+    Identity of a proposal: its type plus the proposal in canonical form.
+    """
+    return type + ":" + json.dumps(proposal, sort_keys=True, separators=(",", ":"), default=str)
+
+
 class FuturePathRegistry:
+    """
+    Future paths bucketed by status, each bucket a heap ordered by
+    (-priority, created_at). Moving a path between statuses pushes one
+    heap entry (O(log n)); superseded entries are skipped lazily and
+    the heap is compacted when they pile up.
+
+    Proposals are deduplicated on content_key(type, proposal): proposing
+    a path that is already pending returns the existing id instead of
+    adding a new one (priority is raised if higher, new notes are kept).
+    """
+
     def __init__(self):
         self.paths: Dict[str, FuturePath] = {}
+        self._by_key: Dict[str, str] = {}        # content key -> path id
+        self._heaps: Dict[str, List[Tuple[float, float, int, str]]] = {s: [] for s in STATUSES}
+        self._live: Dict[str, int] = {s: 0 for s in STATUSES}
+        self._entry: Dict[str, int] = {}          # path id -> seq of its current heap entry
+        self._seq = 0
+        self._listeners: List[Callable[[FuturePath], None]] = []
+
+    # =========================
+    # Heap bookkeeping
+    # =========================
+
+    def _push(self, p: FuturePath):
+        self._seq += 1
+        self._entry[p.path_id] = self._seq
+        heap = self._heaps.setdefault(p.status, [])
+        heapq.heappush(heap, (-p.priority, p.created_at, self._seq, p.path_id))
+
+        if len(heap) > 2 * self._live.get(p.status, 0) + 64:
+            self._compact(p.status)
+
+    def _valid(self, entry: Tuple[float, float, int, str]) -> bool:
+        return self._entry.get(entry[3]) == entry[2]
+
+    def _compact(self, status: str):
+        heap = [e for e in self._heaps[status] if self._valid(e)]
+        heapq.heapify(heap)
+        self._heaps[status] = heap
+
+    def _move(self, p: FuturePath, status: str):
+        if p.status == status:
+            return
+        self._live[p.status] -= 1
+        p.status = status
+        self._live[status] = self._live.get(status, 0) + 1
+        self._push(p)
+
+    # =========================
+    # Public API
+    # =========================
+
+    def subscribe(self, fn: Callable[[FuturePath], None]):
+        """
+        Call fn(path) for every newly created path.
+        """
+        self._listeners.append(fn)
 
     def propose(
         self,
@@ -31,8 +99,21 @@ class FuturePathRegistry:
         novelty_cost: float = 0.3,
         notes: Optional[List[str]] = None,
     ) -> str:
+        key = content_key(type, proposal)
+        pid = self._by_key.get(key)
+        if pid is not None:
+            p = self.paths[pid]
+            if p.status != "experienced":
+                for n in notes or []:
+                    if n not in p.notes:
+                        p.notes.append(n)
+                if priority > p.priority:
+                    p.priority = priority
+                    self._push(p)
+                return pid
+
         pid = str(uuid.uuid4())[:8]
-        self.paths[pid] = FuturePath(
+        p = FuturePath(
             path_id=pid,
             type=type,
             proposal=proposal,
@@ -41,22 +122,50 @@ class FuturePathRegistry:
             novelty_cost=novelty_cost,
             notes=notes or [],
         )
+        self.paths[pid] = p
+        self._by_key[key] = pid
+        self._live[p.status] += 1
+        self._push(p)
+        for fn in self._listeners:
+            fn(p)
         return pid
 
-    def list(self, status: Optional[str] = None) -> List[FuturePath]:
-        items = list(self.paths.values())
-        if status:
-            items = [p for p in items if p.status == status]
-        return sorted(items, key=lambda p: (-p.priority, p.created_at))
+    def list(self, status: Optional[str] = None, limit: Optional[int] = None) -> List[FuturePath]:
+        """
+        Paths ordered by (-priority, created_at), optionally one status only.
+        With a limit, only the top entries are taken off the heaps.
+        """
+        statuses = [status] if status else list(self._heaps)
+        if limit is None:
+            items = [p for p in self.paths.values() if status is None or p.status == status]
+            return sorted(items, key=lambda p: (-p.priority, p.created_at))
+
+        picked: List[Tuple[float, float, int, str]] = []
+        for s in statuses:
+            heap = self._heaps.get(s, [])
+            taken = []
+            while heap and len(taken) < limit:
+                e = heapq.heappop(heap)
+                if self._valid(e):
+                    taken.append(e)
+            for e in taken:
+                heapq.heappush(heap, e)
+            picked.extend(taken)
+
+        picked.sort()
+        return [self.paths[e[3]] for e in picked[:limit]]
+
+    def count(self, status: str) -> int:
+        return self._live.get(status, 0)
 
     def approve(self, path_id: str):
         if path_id in self.paths:
-            self.paths[path_id].status = "approved"
+            self._move(self.paths[path_id], "approved")
 
     def mark_scheduled(self, path_id: str):
         if path_id in self.paths:
-            self.paths[path_id].status = "scheduled"
+            self._move(self.paths[path_id], "scheduled")
 
     def mark_experienced(self, path_id: str):
         if path_id in self.paths:
-            self.paths[path_id].status = "experienced"
\ No newline at end of file
+            self._move(self.paths[path_id], "experienced")
@@ -0,0 +1,247 @@
+# a7do/interaction_ledger.py
+from __future__ import annotations
+
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from a7do.day_series import DaySeries
+from a7do.versioning import ChangeSet, VersionClock
+
+
+class InteractionRecord:
+    """
+    Read-only view of one person's interactions in an InteractionLedger:
+    the latest outcome and day, how many encounters, and all notes.
+
+    Views come from the ledger (ledger[name]); they are no longer built
+    from field values. Record new interactions with ledger.append or
+    WorldProfiles.set_interaction.
+    """
+
+    __slots__ = ("_ledger", "_pid")
+
+    def __init__(self, ledger: "InteractionLedger", pid: int):
+        self._ledger = ledger
+        self._pid = pid
+
+    @property
+    def person_name(self) -> str:
+        return self._ledger.people[self._pid]
+
+    @property
+    def last_outcome(self) -> str:
+        led = self._ledger
+        return led.outcome_names[led.outcome[led._last[self._pid]]]
+
+    @property
+    def last_day(self) -> int:
+        led = self._ledger
+        return led.day[led._last[self._pid]]
+
+    @property
+    def encounter_count(self) -> int:
+        return len(self._ledger._by_person[self._pid])
+
+    @property
+    def notes(self) -> List[str]:
+        return self._ledger.notes_for(self.person_name)
+
+    def __repr__(self) -> str:
+        return (
+            f"InteractionRecord(person_name={self.person_name!r}, last_outcome={self.last_outcome!r}, "
+            f"last_day={self.last_day}, encounter_count={self.encounter_count})"
+        )
+
+
+class InteractionLedger(Mapping):
+    """
+    Append-only log of interactions as compact records
+    (day, person id, outcome id, note ref), with person, outcome and
+    note strings interned.
+
+    Notes of record i are note_ids[note_end[i-1]:note_end[i]]. Per-person
+    and per-(person, outcome) day totals are prefix sums updated on
+    append, so "encounters with X in days 30-60" is two bisects.
+
+    As a mapping it is person name -> InteractionRecord view. Assigning
+    ledger[name] = record appends (see __setitem__); nothing is replaced.
+    """
+
+    def __init__(self, clock: Optional[VersionClock] = None):
+        self.people: List[str] = []
+        self.outcome_names: List[str] = []
+        self.note_texts: List[str] = []
+        self._person_ids: Dict[str, int] = {}
+        self._outcome_ids: Dict[str, int] = {}
+        self._note_ids: Dict[str, int] = {}
+
+        self.day = array("l")
+        self.person = array("l")
+        self.outcome = array("l")
+        self.note_end = array("l")
+        self.note_ids = array("l")
+
+        self._by_person: List[array] = []                   # pid -> record indices
+        self._last: List[int] = []                          # pid -> latest record
+        self._days: List[DaySeries] = []                    # pid -> encounters per day
+        self._outcome_days: List[Dict[int, DaySeries]] = []  # pid -> oid -> per day
+
+        self.changes = ChangeSet(clock or VersionClock())
+
+    @staticmethod
+    def _intern(ids: Dict[str, int], names: List[str], s: str) -> int:
+        i = ids.get(s)
+        if i is None:
+            i = ids[s] = len(names)
+            names.append(s)
+        return i
+
+    # =========================
+    # Writing
+    # =========================
+
+    def append(self, person: str, outcome: str, day: int, notes: Optional[Iterable[str]] = None) -> int:
+        """
+        Record an interaction; returns its record index.
+        """
+        pid = self._person_ids.get(person)
+        if pid is None:
+            pid = self._intern(self._person_ids, self.people, person)
+            self._by_person.append(array("l"))
+            self._last.append(-1)
+            self._days.append(DaySeries())
+            self._outcome_days.append({})
+        oid = self._intern(self._outcome_ids, self.outcome_names, outcome)
+
+        i = len(self.day)
+        self.day.append(day)
+        self.person.append(pid)
+        self.outcome.append(oid)
+        for n in notes or ():
+            self.note_ids.append(self._intern(self._note_ids, self.note_texts, n))
+        self.note_end.append(len(self.note_ids))
+
+        self._by_person[pid].append(i)
+        self._last[pid] = i
+        self._days[pid].add(day, 1)
+        series = self._outcome_days[pid].get(oid)
+        if series is None:
+            series = self._outcome_days[pid][oid] = DaySeries()
+        series.add(day, 1)
+
+        self.changes.mark(person)
+        return i
+
+    def touch(self, person: str):
+        if person in self._person_ids:
+            self.changes.mark(person)
+
+    # =========================
+    # Queries
+    # =========================
+
+    @property
+    def record_count(self) -> int:
+        return len(self.day)
+
+    def _notes(self, i: int) -> List[str]:
+        lo = self.note_end[i - 1] if i else 0
+        return [self.note_texts[n] for n in self.note_ids[lo:self.note_end[i]]]
+
+    def record(self, i: int) -> Dict[str, Any]:
+        return {
+            "day": self.day[i],
+            "person": self.people[self.person[i]],
+            "outcome": self.outcome_names[self.outcome[i]],
+            "notes": self._notes(i),
+        }
+
+    def records(
+        self,
+        person: Optional[str] = None,
+        start_day: Optional[int] = None,
+        end_day: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        if person is None:
+            idx: Iterable[int] = range(len(self.day))
+        else:
+            pid = self._person_ids.get(person)
+            idx = self._by_person[pid] if pid is not None else ()
+        for i in idx:
+            d = self.day[i]
+            if (start_day is None or d >= start_day) and (end_day is None or d <= end_day):
+                yield self.record(i)
+
+    def notes_for(self, person: str) -> List[str]:
+        pid = self._person_ids.get(person)
+        if pid is None:
+            return []
+        out: List[str] = []
+        for i in self._by_person[pid]:
+            out.extend(self._notes(i))
+        return out
+
+    def encounters(
+        self,
+        people: Union[str, Iterable[str]],
+        start_day: Optional[int] = None,
+        end_day: Optional[int] = None,
+    ) -> int:
+        """
+        Encounters with one person, or several (e.g. a family), in [start_day, end_day].
+        """
+        if isinstance(people, str):
+            people = (people,)
+        total = 0.0
+        for p in people:
+            pid = self._person_ids.get(p)
+            if pid is not None:
+                total += self._days[pid].total(start_day, end_day)
+        return int(total)
+
+    def outcomes(self, person: str, start_day: Optional[int] = None, end_day: Optional[int] = None) -> Dict[str, int]:
+        """
+        outcome -> count for one person in [start_day, end_day].
+        """
+        pid = self._person_ids.get(person)
+        if pid is None:
+            return {}
+        out = {}
+        for oid, series in self._outcome_days[pid].items():
+            n = int(series.total(start_day, end_day))
+            if n:
+                out[self.outcome_names[oid]] = n
+        return out
+
+    # =========================
+    # Mapping: person -> InteractionRecord
+    # =========================
+
+    def __getitem__(self, person: str) -> InteractionRecord:
+        pid = self._person_ids.get(person)
+        if pid is None:
+            raise KeyError(person)
+        return InteractionRecord(self, pid)
+
+    def __setitem__(self, person: str, rec: Any):
+        """
+        Old-style `interactions[name] = record`: `rec` is anything with
+        last_outcome, last_day and notes. Appends one interaction with that
+        outcome and day, carrying the notes not already on file for
+        `person`. encounter_count always comes from the ledger itself.
+        """
+        if isinstance(rec, InteractionRecord) and rec._ledger is self and rec.person_name == person:
+            return
+        known = set(self.notes_for(person))
+        notes = [n for n in (getattr(rec, "notes", None) or ()) if n not in known]
+        self.append(person, rec.last_outcome, rec.last_day, notes)
+
+    def __contains__(self, person) -> bool:
+        return person in self._person_ids
+
+    def __len__(self) -> int:
+        return len(self.people)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.people)
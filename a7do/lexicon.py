@@ -0,0 +1,119 @@
+# a7do/lexicon.py
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class Lexicon:
+    """
+    Token exposure counts, kept in (-count, word) order as they change.
+
+    Words sit in per-count buckets (each sorted alphabetically) and the
+    distinct counts are kept sorted, so top-N reads walk buckets from the
+    highest count down instead of sorting the whole lexicon.
+
+    Reads like the plain dict it replaces: get / [] / in / len / items.
+    """
+
+    # Normalisation cache is dropped when it grows past this many raw tokens
+    NORM_CACHE_MAX = 65536
+
+    def __init__(self):
+        self._counts: Dict[str, int] = {}
+        self._buckets: Dict[int, List[str]] = {}
+        self._levels: List[int] = []            # distinct counts, ascending
+        self._norm: Dict[object, str] = {}      # raw token -> normalised
+
+    # =========================
+    # Normalisation
+    # =========================
+
+    def normalise(self, tok) -> str:
+        t = self._norm.get(tok)
+        if t is None:
+            t = str(tok).strip().lower()
+            if len(self._norm) >= self.NORM_CACHE_MAX:
+                self._norm.clear()
+            self._norm[tok] = t
+        return t
+
+    # =========================
+    # Updates
+    # =========================
+
+    def _unbucket(self, word: str, count: int):
+        bucket = self._buckets[count]
+        del bucket[bisect_left(bucket, word)]
+        if not bucket:
+            del self._buckets[count]
+            del self._levels[bisect_left(self._levels, count)]
+
+    def _bucket(self, word: str, count: int):
+        bucket = self._buckets.get(count)
+        if bucket is None:
+            self._buckets[count] = [word]
+            insort(self._levels, count)
+        else:
+            insort(bucket, word)
+
+    def add(self, word: str, n: int = 1):
+        """
+        Add n exposures of an already-normalised word.
+        """
+        old = self._counts.get(word, 0)
+        new = old + n
+        if old:
+            self._unbucket(word, old)
+        self._counts[word] = new
+        self._bucket(word, new)
+
+    def observe(self, tokens: Iterable, weight: int = 1):
+        """
+        Normalise raw tokens and count them; blanks are skipped.
+        """
+        for tok in tokens:
+            t = self.normalise(tok)
+            if t:
+                self.add(t, weight)
+
+    def add_counts(self, counts: Dict[str, int]):
+        """
+        Apply pre-aggregated counts: each word is re-bucketed once.
+        """
+        for word, n in counts.items():
+            self.add(word, n)
+
+    # =========================
+    # Reads
+    # =========================
+
+    def top(self, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        out: List[Tuple[str, int]] = []
+        for count in reversed(self._levels):
+            for word in self._buckets[count]:
+                if limit is not None and len(out) >= limit:
+                    return out
+                out.append((word, count))
+        return out
+
+    def get(self, word: str, default=None):
+        return self._counts.get(word, default)
+
+    def __getitem__(self, word: str) -> int:
+        return self._counts[word]
+
+    def __contains__(self, word) -> bool:
+        return word in self._counts
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __iter__(self):
+        return iter(self._counts)
+
+    def keys(self):
+        return self._counts.keys()
+
+    def items(self):
+        return self._counts.items()
@@ -1,9 +1,13 @@
 # a7do/mind.py
 from __future__ import annotations
-from typing import Any, Dict, List, Optional
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional
 from a7do.body import BiologicalState
 from a7do.somatic import SomaticState
 from a7do.events import ExperienceEvent
+from a7do.columnar import ColumnarLog
+from a7do.lexicon import Lexicon
 
 
 class A7DOMind:
@@ -19,13 +23,13 @@ class A7DOMind:
         self.somatic = SomaticState()
 
         self.day = 0
-        self.trace: List[Dict[str, Any]] = []
-        self.activity: List[Dict[str, Any]] = []   # "thinking timeline"
-        self.lexicon: Dict[str, int] = {}
+        self.trace = ColumnarLog(index_on=("day", "saw"))
+        self.activity = ColumnarLog(index_on=("kind", "day"))   # "thinking timeline"
+        self.lexicon = Lexicon()
         self.last_action: str = "waiting"
 
     def _log(self, kind: str, **payload):
-        self.activity.append({"kind": kind, **payload})
+        self.activity.append(kind=kind, **payload)
 
     def ingest(self, ev: ExperienceEvent, day: int, event_index: int):
         # Internal processing markers
@@ -37,17 +41,26 @@ class A7DOMind:
         self.somatic.decay()
 
         # Lexicon exposure: spoken tokens + emphasis
-        for tok in (ev.sounds_spoken or []):
-            t = str(tok).strip().lower()
-            if t:
-                self.lexicon[t] = self.lexicon.get(t, 0) + 1
-
-        for tok in (ev.emphasis or []):
-            t = str(tok).strip().lower()
-            if t:
-                self.lexicon[t] = self.lexicon.get(t, 0) + 2  # emphasis weighs more
+        self.lexicon.observe(ev.sounds_spoken or [])
+        self.lexicon.observe(ev.emphasis or [], weight=2)  # emphasis weighs more
 
         # Observational trace: co-presence in a place
+        for person in self._write_traces(ev, day, event_index):
+            self._log("trace_write", day=day, event=event_index, saw=person, place=ev.place_id)
+
+        # Somatic hooks (optional, safe defaults)
+        if ev.touch.get("pattern"):
+            self.somatic.apply_touch("chest", 0.15)
+
+        # Store body snapshot into event for observer visibility
+        ev.body = self.body.snapshot()
+        self._log("body", day=day, event=event_index, **ev.body)
+
+    def _write_traces(self, ev: ExperienceEvent, day: int, event_index: int) -> List[str]:
+        """
+        Append trace rows for non-family people present; returns who was seen.
+        """
+        seen: List[str] = []
         if ev.presence:
             for person in ev.presence:
                 if person and person not in ("Mum", "Dad", "Sister"):
@@ -57,19 +70,92 @@ class A7DOMind:
                         "place": ev.place_id,
                         "saw": person,
                         "with": [p for p in ev.presence if p and p != person],
-                        "pets": list(ev.pets or []),
+                        "pets": ev.pets or [],   # stored as an interned tuple, not kept by reference
                         "action": ev.action,
                         "object": ev.obj,
                     })
-                    self._log("trace_write", day=day, event=event_index, saw=person, place=ev.place_id)
+                    seen.append(person)
+        return seen
 
-        # Somatic hooks (optional, safe defaults)
-        if ev.touch.get("pattern"):
-            self.somatic.apply_touch("chest", 0.15)
+    def ingest_many(
+        self,
+        events: Iterable[ExperienceEvent],
+        day: int,
+        start_index: int = 0,
+        on_stage: Optional[Callable[[str, float, int], None]] = None,
+    ):
+        """
+        Ingest a day's events in stages instead of one event at a time.
+        Same end state as calling ingest(ev, day, start_index + i) in order.
 
-        # Store body snapshot into event for observer visibility
-        ev.body = self.body.snapshot()
-        self._log("body", day=day, event=event_index, **ev.body)
+        Stages: body, touch, lexicon, trace, log.
+        Each stage is independent of the others' state, so grouping keeps
+        the result identical; the log stage writes activity rows in the
+        original per-event order. `on_stage(stage, seconds, n_events)` is
+        called after each stage (see a7do.profiling.StageTimer).
+        """
+        events = list(events)
+        if not events:
+            return
+        n = len(events)
+        clock = time.perf_counter
+        indices = range(start_index, start_index + n)
+
+        # --- body: awake drift, then per-event snapshot
+        t0 = clock()
+        body = self.body
+        snapshots = []
+        for ev in events:
+            body.update()
+            ev.body = body.snapshot()
+            snapshots.append(ev.body)
+        if on_stage:
+            on_stage("body", clock() - t0, n)
+
+        # --- touch: somatic decay + touch hook per event
+        t0 = clock()
+        somatic = self.somatic
+        for ev in events:
+            somatic.decay()
+            if ev.touch.get("pattern"):
+                somatic.apply_touch("chest", 0.15)
+        if on_stage:
+            on_stage("touch", clock() - t0, n)
+
+        # --- lexicon: tally the whole batch, apply once
+        t0 = clock()
+        tally: Counter = Counter()
+        norm = self.lexicon.normalise
+        for ev in events:
+            for tok in (ev.sounds_spoken or []):
+                t = norm(tok)
+                if t:
+                    tally[t] += 1
+            for tok in (ev.emphasis or []):
+                t = norm(tok)
+                if t:
+                    tally[t] += 2
+        self.lexicon.add_counts(tally)
+        if on_stage:
+            on_stage("lexicon", clock() - t0, n)
+
+        # --- trace: co-presence rows
+        t0 = clock()
+        seen = [self._write_traces(ev, day, i) for ev, i in zip(events, indices)]
+        if on_stage:
+            on_stage("trace", clock() - t0, n)
+
+        # --- log: activity timeline in sequential order
+        t0 = clock()
+        log = self._log
+        for ev, i, people, snap in zip(events, indices, seen, snapshots):
+            log("ingest", day=day, event=i, place=ev.place_id, room=ev.room)
+            for person in people:
+                log("trace_write", day=day, event=i, saw=person, place=ev.place_id)
+            log("body", day=day, event=i, **snap)
+        self.last_action = f"ingest event {indices[-1]}"
+        if on_stage:
+            on_stage("log", clock() - t0, n)
 
     def sleep(self, day: int):
         self.last_action = "sleep"
@@ -78,8 +164,8 @@ class A7DOMind:
         # In this phase, “sleep” does not invent meaning; it just marks consolidation.
         self._log("sleep_end", day=day, body=self.body.snapshot())
 
-    def known_words(self) -> Dict[str, int]:
-        return dict(sorted(self.lexicon.items(), key=lambda x: (-x[1], x[0])))
+    def known_words(self, limit: Optional[int] = None) -> Dict[str, int]:
+        return dict(self.lexicon.top(limit))
 
     def summary(self) -> Dict[str, Any]:
         return {
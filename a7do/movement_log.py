@@ -0,0 +1,129 @@
+# a7do/movement_log.py
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from a7do.day_series import DaySeries
+
+
+class MovementLog:
+    """
+    Compact A7DO movement log with running aggregates.
+
+    Each move is a typed record (day, event index, from id, to id) with
+    interned place ids. Visit counts, dwell per place and the transition
+    matrix are updated on every append, so observer queries such as
+    "time at the park over the last 30 days" never rescan the log.
+
+    Dwell is measured in events spent at a place (see Schedule.next_event).
+    Iterating / indexing yields the same dicts the old list held.
+    """
+
+    def __init__(self, actor: str = "A7DO"):
+        self.actor = actor
+
+        self._ids: Dict[str, int] = {}
+        self.places: List[str] = []
+
+        self.day = array("l")
+        self.event = array("l")
+        self.src = array("l")
+        self.dst = array("l")
+
+        self._visits: Dict[int, DaySeries] = {}
+        self._dwell: Dict[int, DaySeries] = {}
+        self._transitions: Dict[Tuple[int, int], int] = {}
+
+    def place_id(self, place: str) -> int:
+        pid = self._ids.get(place)
+        if pid is None:
+            pid = len(self.places)
+            self._ids[place] = pid
+            self.places.append(place)
+        return pid
+
+    # =========================
+    # Writing
+    # =========================
+
+    def append(self, day: int, event: int, frm: str, to: str):
+        a, b = self.place_id(frm), self.place_id(to)
+        self.day.append(day)
+        self.event.append(event)
+        self.src.append(a)
+        self.dst.append(b)
+
+        self._transitions[(a, b)] = self._transitions.get((a, b), 0) + 1
+        series = self._visits.get(b)
+        if series is None:
+            series = self._visits[b] = DaySeries()
+        series.add(day, 1)
+
+    def accrue(self, day: int, place: str, amount: float = 1.0):
+        """
+        Add dwell time at `place` on `day`.
+        """
+        pid = self.place_id(place)
+        series = self._dwell.get(pid)
+        if series is None:
+            series = self._dwell[pid] = DaySeries()
+        series.add(day, amount)
+
+    # =========================
+    # Queries
+    # =========================
+
+    def visits(self, place: str, start_day: Optional[int] = None, end_day: Optional[int] = None) -> int:
+        pid = self._ids.get(place)
+        series = self._visits.get(pid) if pid is not None else None
+        return int(series.total(start_day, end_day)) if series else 0
+
+    def dwell(self, place: str, start_day: Optional[int] = None, end_day: Optional[int] = None) -> float:
+        pid = self._ids.get(place)
+        series = self._dwell.get(pid) if pid is not None else None
+        return series.total(start_day, end_day) if series else 0.0
+
+    def transition_count(self, frm: str, to: str) -> int:
+        a, b = self._ids.get(frm), self._ids.get(to)
+        if a is None or b is None:
+            return 0
+        return self._transitions.get((a, b), 0)
+
+    def transitions(self) -> Dict[str, Dict[str, int]]:
+        """
+        Transition matrix as {from: {to: count}}.
+        """
+        out: Dict[str, Dict[str, int]] = {}
+        for (a, b), n in self._transitions.items():
+            out.setdefault(self.places[a], {})[self.places[b]] = n
+        return out
+
+    # =========================
+    # List-like access
+    # =========================
+
+    def _record(self, i: int) -> Dict[str, Any]:
+        return {
+            "day": self.day[i],
+            "event": self.event[i],
+            "actor": self.actor,
+            "from": self.places[self.src[i]],
+            "to": self.places[self.dst[i]],
+        }
+
+    def __len__(self) -> int:
+        return len(self.day)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._record(i) for i in range(*key.indices(len(self)))]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("movement index out of range")
+        return self._record(key)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._record(i)
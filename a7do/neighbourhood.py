@@ -0,0 +1,296 @@
+# a7do/neighbourhood.py
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from a7do.profiles import PersonProfile
+from a7do.containers import FrozenDict
+
+
+FIRST_NAMES_M = ("James", "Craig", "Tom", "Mark", "Owen", "Liam", "Noah", "Leo", "Finn", "Alex")
+FIRST_NAMES_F = ("Sarah", "Mags", "Emma", "Sophie", "Zoe", "Ava", "Mia", "Ella", "Grace", "Lucy")
+HAIR = ("brown", "blonde", "black", "red", "grey")
+EYES = ("blue", "green", "brown", "hazel")
+
+# Family slots (columns). BIODAD is a name only, never a profile.
+DAD, MUM, BOY, GIRL, STEPDAD, BIODAD = range(6)
+N_SLOTS = 6
+SUFFIX = ("Dad", "Mum", "Boy", "Girl", "StepDad", "BioDad")
+ROLE = ("neighbour_dad", "neighbour_mum", "neighbour_child", "neighbour_child", "neighbour_stepdad", None)
+FAMILY_KEY = ("dad", "mum", "child1", "child2", "stepdad", "biodad")
+FEMALE = np.array([False, True, False, True, False, False])
+
+STYLES = ("standard", "single_mum", "single_dad", "blended")
+STANDARD, SINGLE_MUM, SINGLE_DAD, BLENDED = range(4)
+
+# Per style: slots that get a profile (in people order), a feature per
+# slot, age range per slot, and the placeholder cards for absent parents.
+_PEOPLE = {
+    STANDARD: (DAD, MUM, BOY, GIRL),
+    SINGLE_MUM: (MUM, BOY, GIRL),
+    SINGLE_DAD: (DAD, BOY, GIRL),
+    BLENDED: (MUM, STEPDAD, BOY, GIRL),
+}
+_FAMILY = {
+    STANDARD: (DAD, MUM, BOY, GIRL),
+    SINGLE_MUM: (MUM, BOY, GIRL),
+    SINGLE_DAD: (DAD, BOY, GIRL),
+    BLENDED: (MUM, STEPDAD, BIODAD, BOY, GIRL),
+}
+_CARDS = {
+    SINGLE_MUM: {"dad": "unknown_dad_card"},
+    SINGLE_DAD: {"mum": "unknown_mum_card"},
+}
+_FEATURE = {
+    (STANDARD, DAD): "hello wave",
+    (STANDARD, MUM): "warm smile",
+    (SINGLE_MUM, MUM): "tired smile",
+    (SINGLE_DAD, DAD): "gentle voice",
+    (BLENDED, MUM): "confident",
+    (BLENDED, STEPDAD): "friendly",
+}
+# Family ties served to RelationshipGraph (see NeighbourPopulation.edge_*):
+# child --parent--> each parent, partner <-> partner, sibling <-> sibling.
+_PARENTS = {
+    STANDARD: (DAD, MUM),
+    SINGLE_MUM: (MUM,),
+    SINGLE_DAD: (DAD,),
+    BLENDED: (MUM, STEPDAD),
+}
+_CHILDREN = (BOY, GIRL)
+FAMILY_RELS = ("parent", "partner", "sibling")
+_NONE: frozenset = frozenset()
+
+_AGE_LO = np.array([24, 24, 4, 4, 24, 24], dtype=np.int16)
+_AGE_HI = np.array(
+    [
+        [50, 50, 10, 10, 50, 50],   # standard
+        [45, 45, 10, 10, 50, 50],   # single_mum
+        [45, 45, 10, 10, 50, 50],   # single_dad
+        [45, 45, 10, 10, 50, 50],   # blended
+    ],
+    dtype=np.int16,
+)
+
+
+class NeighbourPopulation:
+    """
+    Neighbour families held as struct-of-arrays: one row per door, one
+    column per family slot (dad, mum, boy, girl, stepdad, biodad).
+
+    Everything is drawn in bulk from one seeded NumPy stream; names are
+    "<First>_<door>_<Suffix>" and are formatted only when asked for, and
+    PersonProfile objects are built on access (see profiles.PeopleIndex).
+    """
+
+    def __init__(self):
+        self.doors: List[Any] = []
+        self._row: Dict[str, int] = {}       # str(door) -> row
+        self.style = np.zeros(0, dtype=np.uint8)
+        self.first = np.zeros((0, N_SLOTS), dtype=np.uint8)
+        self.age = np.zeros((0, N_SLOTS), dtype=np.uint8)
+        self.hair = np.zeros((0, N_SLOTS), dtype=np.uint8)
+        self.eyes = np.zeros((0, N_SLOTS), dtype=np.uint8)
+        self.live = np.zeros(0, dtype=bool)  # False once a door is regenerated
+        self.born = np.zeros(0, dtype=np.int64)   # version each row was generated at
+        self.died = np.zeros(0, dtype=np.int64)   # version it was replaced at (0 = live)
+        self.people_count = 0
+        # name -> (row, slot) for live people; built on first locate()
+        self._by_name: Optional[Dict[str, Tuple[int, int]]] = None
+
+    @classmethod
+    def generate(cls, seed: int, door_numbers: Sequence[Any]) -> "NeighbourPopulation":
+        pop = cls()
+        pop.extend(seed, door_numbers)
+        return pop
+
+    def extend(self, seed: int, door_numbers: Sequence[Any], version: int = 0):
+        """
+        Generate families for more doors. A door generated again replaces
+        its earlier family. `version` stamps the new (and replaced) rows
+        for change tracking.
+        """
+        n = len(door_numbers)
+        rng = np.random.default_rng(seed)
+
+        style = np.zeros(n, dtype=np.uint8)
+        specials = rng.choice(n, size=min(3, n), replace=False)
+        style[specials] = np.arange(1, len(specials) + 1)
+
+        first = rng.integers(0, len(FIRST_NAMES_M), size=(n, N_SLOTS), dtype=np.uint8)
+        hi = _AGE_HI[style]
+        age = (_AGE_LO + np.floor(rng.random((n, N_SLOTS)) * (hi - _AGE_LO + 1))).astype(np.uint8)
+        hair = rng.integers(0, len(HAIR), size=(n, N_SLOTS), dtype=np.uint8)
+        eyes = rng.integers(0, len(EYES), size=(n, N_SLOTS), dtype=np.uint8)
+
+        base = len(self.doors)
+        keys = [str(d) for d in door_numbers]
+        if self._row:
+            for key in keys:
+                old = self._row.get(key)
+                if old is not None and self.live[old]:
+                    self.live[old] = False
+                    self.died[old] = version
+                    self.people_count -= len(_PEOPLE[int(self.style[old])])
+                    if self._by_name is not None:
+                        for slot in _PEOPLE[int(self.style[old])]:
+                            self._by_name.pop(self.name(old, slot), None)
+        self._row.update(zip(keys, range(base, base + n)))
+        self.doors.extend(door_numbers)
+
+        self.style = np.concatenate([self.style, style])
+        self.first = np.concatenate([self.first, first])
+        self.age = np.concatenate([self.age, age])
+        self.hair = np.concatenate([self.hair, hair])
+        self.eyes = np.concatenate([self.eyes, eyes])
+        live = np.ones(n, dtype=bool)
+        if len(set(keys)) < n:
+            # repeated door within this call: the last one wins
+            live = np.array([self._row[k] == base + j for j, k in enumerate(keys)])
+        self.live = np.concatenate([self.live, live])
+        self.born = np.concatenate([self.born, np.full(n, version, dtype=np.int64)])
+        self.died = np.concatenate([self.died, np.where(live, 0, version).astype(np.int64)])
+
+        counts = np.array([len(_PEOPLE[s]) for s in range(len(STYLES))])
+        self.people_count += int(counts[style[live]].sum())
+        if self._by_name is not None:
+            self._index_names(base + np.flatnonzero(live))
+
+    def _index_names(self, rows: np.ndarray):
+        by_name = self._by_name
+        styles = self.style[rows]
+        for style, people in _PEOPLE.items():
+            sel = rows[styles == style]
+            if not len(sel):
+                continue
+            doors = [self.doors[r] for r in sel.tolist()]
+            for slot in people:
+                names = FIRST_NAMES_F if FEMALE[slot] else FIRST_NAMES_M
+                suffix = SUFFIX[slot]
+                for row, f, door in zip(sel.tolist(), self.first[sel, slot].tolist(), doors):
+                    by_name[f"{names[f]}_{door}_{suffix}"] = (row, slot)
+
+    def __getstate__(self):
+        # the name index is rebuilt on first locate()
+        state = dict(self.__dict__)
+        state["_by_name"] = None
+        return state
+
+    # =========================
+    # Per-person access
+    # =========================
+
+    def __len__(self) -> int:
+        return self.people_count
+
+    def name(self, row: int, slot: int) -> str:
+        names = FIRST_NAMES_F if FEMALE[slot] else FIRST_NAMES_M
+        return f"{names[self.first[row, slot]]}_{self.doors[row]}_{SUFFIX[slot]}"
+
+    def locate(self, name: str) -> Optional[Tuple[int, int]]:
+        """
+        (row, slot) of the live person with this name, or None.
+        """
+        if self._by_name is None:
+            self._by_name = {}
+            self._index_names(np.flatnonzero(self.live))
+        return self._by_name.get(name)
+
+    def names(self, rows=None) -> Iterator[str]:
+        """
+        Names of everyone in `rows` (default: all live rows).
+        """
+        for row in np.flatnonzero(self.live) if rows is None else rows:
+            for slot in _PEOPLE[int(self.style[row])]:
+                yield self.name(row, slot)
+
+    def records(self, rows=None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        (name, record) for everyone in `rows` (default: all live rows).
+        """
+        for row in np.flatnonzero(self.live) if rows is None else rows:
+            for slot in _PEOPLE[int(self.style[row])]:
+                yield self.name(row, slot), self.record(row, slot)
+
+    def born_since(self, version: int) -> np.ndarray:
+        return np.flatnonzero(self.live & (self.born > version))
+
+    def died_since(self, version: int) -> np.ndarray:
+        return np.flatnonzero((self.died > version) & (self.born <= version))
+
+    def record(self, row: int, slot: int) -> Dict[str, Any]:
+        feature = _FEATURE.get((int(self.style[row]), slot))
+        return {
+            "role": ROLE[slot],
+            "age": int(self.age[row, slot]),
+            "hair": HAIR[self.hair[row, slot]],
+            "eyes": EYES[self.eyes[row, slot]],
+            "features": [feature] if feature else [],
+        }
+
+    def profile(self, row: int, slot: int) -> PersonProfile:
+        r = self.record(row, slot)
+        return PersonProfile(self.name(row, slot), r["role"], r["age"], r["hair"], r["eyes"], r["features"])
+
+    # =========================
+    # Family edges (derived source for RelationshipGraph)
+    # =========================
+
+    edge_rels = FAMILY_RELS
+
+    def _tie(self, name: str, rel: str, outgoing: bool) -> frozenset:
+        at = self.locate(name)
+        if at is None:
+            return _NONE
+        row, slot = at
+        parents = _PARENTS[int(self.style[row])]
+        if rel == "parent":
+            if outgoing:
+                group = parents if slot in _CHILDREN else ()
+            else:
+                group = _CHILDREN if slot in parents else ()
+        elif rel == "partner":
+            group = [s for s in parents if s != slot] if len(parents) > 1 and slot in parents else ()
+        elif rel == "sibling":
+            group = [s for s in _CHILDREN if s != slot] if slot in _CHILDREN else ()
+        else:
+            return _NONE
+        return frozenset(self.name(row, s) for s in group)
+
+    def edge_targets(self, name: str, rel: str) -> frozenset:
+        """
+        Generated family members `name` has as `rel` (a child's parents, ...).
+        """
+        return self._tie(name, rel, True)
+
+    def edge_sources(self, name: str, rel: str) -> frozenset:
+        """
+        Generated family members who have `name` as `rel` (a parent's children, ...).
+        """
+        return self._tie(name, rel, False)
+
+    # =========================
+    # Per-door access
+    # =========================
+
+    def has_door(self, door) -> bool:
+        return str(door) in self._row
+
+    def live_doors(self) -> Iterator[Any]:
+        for row in np.flatnonzero(self.live):
+            yield self.doors[row]
+
+    def family(self, door) -> FrozenDict:
+        row = self._row[str(door)]
+        style = int(self.style[row])
+        fam: Dict[str, str] = {"style": STYLES[style]}
+        for slot in _FAMILY[style]:
+            fam[FAMILY_KEY[slot]] = self.name(row, slot)
+        fam.update(_CARDS.get(style, {}))
+        return FrozenDict(fam)
+
+    @property
+    def door_count(self) -> int:
+        return int(self.live.sum())
@@ -1,14 +1,21 @@
 # a7do/newborn_routine.py
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
+import hashlib
+import heapq
+import json
+import pickle
 import random
 from a7do.events import ExperienceEvent
+from a7do.scene_templates import SceneTemplate, register_scene
 
 @dataclass
 class TimeCompression:
-    real_minutes_per_event: int = 30
-    sim_seconds_per_event: int = 30
+    real_minutes_per_event: int = 30   # life-clock spacing between learning events
+    sim_seconds_per_event: int = 30    # playback time per event
 
 @dataclass
 class NewbornConfig:
@@ -18,10 +25,165 @@ class NewbornConfig:
     change_interval_hours: int = 2
     sleep_blocks: Optional[List[Dict[str, int]]] = None  # e.g. [{"start":0,"hours":2}, ...]
     transport_modes: List[str] = None
+    wake_hour: float = 7.0
+    compression: Optional[TimeCompression] = None
 
     def __post_init__(self):
         if self.transport_modes is None:
-            self.transport_modes = ["car", "buggy", "bus"]
+            self.transport_modes = list(DEFAULT_TRANSPORT_MODES)
+        if self.compression is None:
+            self.compression = TimeCompression()
+
+# -------------------------
+# Scene templates (shared payloads, copy-on-write per event)
+# -------------------------
+
+WAKE = register_scene(
+    "newborn.wake", "bedroom_a7do", ["Mum"],
+    {"sound": "morning voices", "light": "soft"},
+    ["good", "morning"],
+    note="Wake",
+)
+HOSPITAL_OVERNIGHT = register_scene(
+    "newborn.hospital_overnight", "hospital", ["Mum", "Nurse"],
+    {"sound": "quiet ward", "touch": "gentle hold"},
+    ["shh", "sleep"],
+    note="Hospital overnight: calm ward",
+)
+HOME_SCENES = {
+    "blanket_kick": register_scene(
+        "newborn.blanket_kick", "house_a7do", ["Mum"],
+        {"touch": "blanket", "vision": "ceiling", "sound": "mum voice"},
+        ["kicking", "legs"],
+        {"motor": "legs_kicking"},
+        note="Living room blanket: kicking legs prompt",
+    ),
+    "grab_finger": register_scene(
+        "newborn.grab_finger", "house_a7do", ["Mum"],
+        {"touch": "finger", "sound": "mum laugh"},
+        ["got", "my", "finger"],
+        {"motor": "grasp"},
+        note="Grab mum finger: reinforcement",
+    ),
+    "nursery_toes": register_scene(
+        "newborn.nursery_toes", "house_a7do", ["Mum"],
+        {"touch": "toes", "sound": "sing-song"},
+        ["this", "little", "piggy", "toe", "toe", "toe"],
+        {"touch_zone": "feet"},
+        note="Nursery rhyme: toe repetition",
+    ),
+    "look_object": register_scene(
+        "newborn.look_object", "house_a7do", ["Mum"],
+        {"vision": "object close", "sound": "labelled slowly"},
+        ["look"],
+        note="Home object glimpse (future: TV/ball/chair)",
+    ),
+}
+FEED = register_scene(
+    "newborn.feed", "house_a7do", ["Mum"],
+    {"touch": "held", "sound": "soft voice"},
+    ["feed"],
+    {"hunger": "reduced"},
+    note="Feeding routine (~2h)",
+)
+CHANGE = register_scene(
+    "newborn.change", "house_a7do", ["Mum"],
+    {"touch": "change", "sound": "rustle"},
+    ["change"],
+    {"discomfort": "reduced"},
+    note="Nappy change routine (~2h)",
+)
+NAP = register_scene(
+    "newborn.nap", "bedroom_a7do", ["Mum"],
+    {"sound": "quiet", "light": "dim", "touch": "blanket"},
+    ["sleep"],
+    {"sleep": "onset"},
+    note="Nap (sleep block)",
+)
+BED_SLEEP = register_scene(
+    "newborn.bed_sleep", "bedroom_a7do", ["Mum"],
+    {"sound": "quiet", "light": "dark", "touch": "blanket"},
+    ["sleep"],
+    {"sleep": "onset"},
+    note="Bedtime sleep",
+)
+
+
+OUTING_PLACES = ("park", "shops", "doctors")
+DEFAULT_TRANSPORT_MODES = ("car", "buggy", "bus")
+
+# (place, mode) -> template
+OUTINGS: Dict[Tuple[str, str], SceneTemplate] = {}
+
+
+def register_outings(modes: Iterable[str]):
+    """
+    Register the outing scene for every place and each of `modes`
+    (pairs already registered are kept).
+    """
+    for mode in modes:
+        for place in OUTING_PLACES:
+            if (place, mode) not in OUTINGS:
+                OUTINGS[place, mode] = register_scene(
+                    f"newborn.outing.{mode}.{place}", place, ["Mum"],
+                    {"motion": f"{mode} moving", "sound": "birds" if place == "park" else "indoor hum"},
+                    [place],
+                    note=f"Outing: {mode} to {place}",
+                )
+
+
+register_outings(DEFAULT_TRANSPORT_MODES)
+
+
+def config_hash(cfg: NewbornConfig) -> str:
+    """
+    Stable digest of a config, for cache keys. `days` (curriculum
+    length) is left out: a day's events do not depend on it, so
+    lengthening the curriculum keeps the cached days.
+    """
+    fields = asdict(cfg)
+    fields.pop("days", None)
+    blob = json.dumps(fields, sort_keys=True, default=str)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+
+
+class DayCache:
+    """
+    Built days keyed by (seed, config hash, day, overnight_in_hospital).
+    Days are stored pickled: compact, and every hit returns fresh events
+    that callers are free to mutate. Oldest entries are evicted past
+    `max_days` (None = unbounded).
+    """
+
+    def __init__(self, max_days: Optional[int] = None):
+        self.max_days = max_days
+        self._days: "OrderedDict[tuple, bytes]" = OrderedDict()
+
+    def get(self, key: tuple) -> Optional[bytes]:
+        blob = self._days.get(key)
+        if blob is not None:
+            self._days.move_to_end(key)
+        return blob
+
+    def put(self, key: tuple, blob: bytes):
+        self._days[key] = blob
+        self._days.move_to_end(key)
+        if self.max_days is not None:
+            while len(self._days) > self.max_days:
+                self._days.popitem(last=False)
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._days
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+
+def _build_day_blob(args: Tuple[int, "NewbornConfig", int, bool]) -> bytes:
+    # Process-pool entry point: must live at module level to be picklable
+    seed, cfg, day, overnight = args
+    return pickle.dumps(NewbornRoutine(seed, cfg).build_day(day, overnight), pickle.HIGHEST_PROTOCOL)
+
 
 class NewbornRoutine:
     """
@@ -29,9 +191,60 @@ class NewbornRoutine:
     Produces a grounded list of ExperienceEvent entries for a given day.
     """
 
-    def __init__(self, seed: int = 7, config: Optional[NewbornConfig] = None):
+    def __init__(self, seed: int = 7, config: Optional[NewbornConfig] = None, cache: Optional[DayCache] = None):
         self.seed = seed
         self.cfg = config or NewbornConfig()
+        self.cache = cache
+        register_outings(self.cfg.transport_modes)
+
+    def build_days(
+        self,
+        days: Iterable[int],
+        workers: int = 1,
+        overnight_in_hospital: bool = False,
+        chunksize: int = 8,
+    ) -> Iterator[Tuple[int, List[ExperienceEvent]]]:
+        """
+        Build many days, yielding (day, events) in the order given.
+
+        Each day seeds its own RNG, so days are independent and can be built
+        in a process pool (workers > 1); output is identical to build_day().
+        With a cache attached, days already built are served from it and
+        new ones are stored.
+        """
+        days = list(days)
+        cfg_key = config_hash(self.cfg)
+
+        def key(d: int) -> tuple:
+            return (self.seed, cfg_key, d, overnight_in_hospital)
+
+        cache = self.cache
+        if cache is None:
+            missing = days
+        else:
+            missing = list(dict.fromkeys(d for d in days if key(d) not in cache))
+        pending = set(missing)
+        jobs = [(self.seed, self.cfg, d, overnight_in_hospital) for d in missing]
+
+        pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(jobs) > 1 else None
+        try:
+            built = pool.map(_build_day_blob, jobs, chunksize=chunksize) if pool else map(_build_day_blob, jobs)
+            for d in days:
+                if cache is None:
+                    blob = next(built)
+                elif d in pending:
+                    pending.discard(d)
+                    blob = next(built)
+                    cache.put(key(d), blob)
+                else:
+                    blob = cache.get(key(d))
+                    if blob is None:  # evicted since we checked
+                        blob = _build_day_blob((self.seed, self.cfg, d, overnight_in_hospital))
+                        cache.put(key(d), blob)
+                yield d, pickle.loads(blob)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
 
     def build_day(self, day: int, overnight_in_hospital: bool = False) -> List[ExperienceEvent]:
         rng = random.Random(self.seed * 10000 + day)
@@ -39,6 +252,7 @@ class NewbornRoutine:
         idx = 0
 
         # Day 0 is special: birth + (overnight OR journey home)
+        # (stamped at even spacing from wake; there is no routine yet)
         if day == 0:
             birth = self._birth_block(day, idx)
             events.extend(birth)
@@ -57,22 +271,20 @@ class NewbornRoutine:
 
             # End day in bed at home regardless
             events.extend(self._bed_sleep_block(day, idx))
+            step = 60.0 * self.cfg.compression.real_minutes_per_event
+            for i, ev in enumerate(events):
+                ev.timestamp = 3600.0 * self.cfg.wake_hour + i * step
             return self._reindex(events)
 
         # Day 1+: standard newborn day anchored at home
         # We generate 15 learning events plus auto feed/change/sleep threads
-        schedule = []
-        schedule.extend(self._wake_block(day, rng))
+        wake = self._wake_block(day, rng)
 
         # Create 15 learning events: mix of home scenes and occasional out-of-house
-        for _ in range(self.cfg.learning_events_per_day):
-            schedule.append(self._learning_event(day, rng))
+        learning = [self._learning_event(day, rng) for _ in range(self.cfg.learning_events_per_day)]
 
-        # Insert feeding + changing as repeating necessities
-        schedule = self._insert_feeds_and_changes(day, schedule, rng)
-
-        # End with sleep
-        schedule.extend(self._bed_sleep_block(day, 0))
+        # Merge feeding, changing and sleep blocks in on the routine clock
+        schedule = self._schedule_day(day, wake + learning)
 
         return self._reindex(schedule)
 
@@ -102,16 +314,7 @@ class NewbornRoutine:
 
     def _hospital_overnight_block(self, day: int, idx: int, rng: random.Random) -> List[ExperienceEvent]:
         # gentle repeats: feeding / nappy / sleep / voices
-        out = []
-        for k in range(4):
-            out.append(ExperienceEvent(
-                day=day, index=idx+k, place="hospital",
-                people_present=["Mum", "Nurse"],
-                sensory={"sound": "quiet ward", "touch": "gentle hold"},
-                sounds=["shh", "sleep"],
-                note="Hospital overnight: calm ward"
-            ))
-        return out
+        return [HOSPITAL_OVERNIGHT.make(day, idx+k) for k in range(4)]
 
     def _journey_home_block(self, day: int, idx: int, rng: random.Random) -> List[ExperienceEvent]:
         mode = rng.choice(["car", "buggy"])
@@ -149,13 +352,7 @@ class NewbornRoutine:
         ]
 
     def _wake_block(self, day: int, rng: random.Random) -> List[ExperienceEvent]:
-        return [ExperienceEvent(
-            day=day, index=0, place="bedroom_a7do",
-            people_present=["Mum"],
-            sensory={"sound": "morning voices", "light": "soft"},
-            sounds=["good", "morning"],
-            note="Wake"
-        )]
+        return [WAKE.make(day)]
 
     def _learning_event(self, day: int, rng: random.Random) -> ExperienceEvent:
         # mostly home; sometimes out (park / shops / doctors)
@@ -169,101 +366,89 @@ class NewbornRoutine:
         # Example learning scenes: kicking legs, grabbing finger, blanket time, nursery rhyme
         scenes = ["blanket_kick", "grab_finger", "nursery_toes", "look_object"]
         s = rng.choice(scenes)
-
-        if s == "blanket_kick":
-            return ExperienceEvent(
-                day=day, index=0, place="house_a7do",
-                people_present=["Mum"],
-                sensory={"touch": "blanket", "vision": "ceiling", "sound": "mum voice"},
-                sounds=["kicking", "legs"],
-                body_effects={"motor": "legs_kicking"},
-                note="Living room blanket: kicking legs prompt"
-            )
-
-        if s == "grab_finger":
-            return ExperienceEvent(
-                day=day, index=0, place="house_a7do",
-                people_present=["Mum"],
-                sensory={"touch": "finger", "sound": "mum laugh"},
-                sounds=["got", "my", "finger"],
-                body_effects={"motor": "grasp"},
-                note="Grab mum finger: reinforcement"
-            )
-
-        if s == "nursery_toes":
-            return ExperienceEvent(
-                day=day, index=0, place="house_a7do",
-                people_present=["Mum"],
-                sensory={"touch": "toes", "sound": "sing-song"},
-                sounds=["this", "little", "piggy", "toe", "toe", "toe"],
-                body_effects={"touch_zone": "feet"},
-                note="Nursery rhyme: toe repetition"
-            )
-
-        # look_object
-        return ExperienceEvent(
-            day=day, index=0, place="house_a7do",
-            people_present=["Mum"],
-            sensory={"vision": "object close", "sound": "labelled slowly"},
-            sounds=["look"],
-            note="Home object glimpse (future: TV/ball/chair)"
-        )
+        return HOME_SCENES[s].make(day)
 
     def _outing_scene(self, day: int, rng: random.Random) -> ExperienceEvent:
-        place = rng.choice(["park", "shops", "doctors"])
+        place = rng.choice(OUTING_PLACES)
         mode = rng.choice(self.cfg.transport_modes)
 
         # Transport sub-event + arrival event (we keep it compact for now)
-        return ExperienceEvent(
-            day=day, index=0, place=place,
-            people_present=["Mum"],
-            sensory={"motion": f"{mode} moving", **({"sound": "birds"} if place=="park" else {"sound": "indoor hum"})},
-            sounds=[place],
-            note=f"Outing: {mode} to {place}"
-        )
-
-    def _insert_feeds_and_changes(self, day: int, events: List[ExperienceEvent], rng: random.Random) -> List[ExperienceEvent]:
+        return OUTINGS[place, mode].make(day)
+
+    def _schedule_day(self, day: int, learning: List[ExperienceEvent]) -> List[ExperienceEvent]:
         """
-        Insert feeding + nappy changes roughly every 2 hours.
-        We don't simulate clock time precisely here; we weave them every ~4 events.
+        Lay the day out on a simulated clock (seconds since midnight).
+
+        Learning events run from wake_hour, one every
+        compression.real_minutes_per_event. Feeds and changes recur every
+        feed_interval_hours / change_interval_hours, and each sleep block
+        emits a nap and holds everything else until it ends (later events
+        slide back). Every stream sits in one heap keyed by (time,
+        priority), so a day costs O((n + k) log k) for n events and k
+        streams. The day closes with bedtime one step after the last
+        learning event; recurring needs due after that are dropped.
         """
-        out = []
-        feed_every = 4
-        change_every = 4
-        for i, ev in enumerate(events):
+        cfg = self.cfg
+        step = 60.0 * cfg.compression.real_minutes_per_event
+        wake = 3600.0 * cfg.wake_hour
+
+        # stream ids double as tie-break priority at equal times
+        SLEEP, FEED_S, CHANGE_S, LEARN = 0, 1, 2, 3
+        intervals = {FEED_S: 3600.0 * cfg.feed_interval_hours, CHANGE_S: 3600.0 * cfg.change_interval_hours}
+
+        heap: List[Tuple[float, int, int]] = []   # (time, stream, block index)
+        if learning:
+            heap.append((wake, LEARN, 0))
+        for stream, interval in intervals.items():
+            if interval > 0:
+                heap.append((wake + interval, stream, 0))
+        blocks = []
+        for b in (cfg.sleep_blocks or []):
+            start = 3600.0 * b["start"]
+            end = start + 3600.0 * b["hours"]
+            if end > wake:
+                heap.append((max(start, wake), SLEEP, len(blocks)))
+                blocks.append(end)
+        heapq.heapify(heap)
+
+        out: List[ExperienceEvent] = []
+        next_learning = 0
+        asleep_until = wake
+        bedtime: Optional[float] = None
+
+        while heap:
+            t, stream, b = heapq.heappop(heap)
+            if bedtime is not None and t >= bedtime:
+                continue
+            if t < asleep_until:
+                heapq.heappush(heap, (asleep_until, stream, b))
+                continue
+
+            if stream == LEARN:
+                ev = learning[next_learning]
+                next_learning += 1
+                if next_learning < len(learning):
+                    heapq.heappush(heap, (t + step, LEARN, 0))
+                else:
+                    bedtime = t + step
+            elif stream == SLEEP:
+                ev = NAP.make(day)
+                asleep_until = blocks[b]
+            else:
+                ev = (FEED if stream == FEED_S else CHANGE).make(day)
+                heapq.heappush(heap, (t + intervals[stream], stream, 0))
+
+            ev.timestamp = t
             out.append(ev)
 
-            if i > 0 and i % feed_every == 0:
-                out.append(ExperienceEvent(
-                    day=day, index=0, place="house_a7do",
-                    people_present=["Mum"],
-                    sensory={"touch": "held", "sound": "soft voice"},
-                    sounds=["feed"],
-                    body_effects={"hunger": "reduced"},
-                    note="Feeding routine (~2h)"
-                ))
-            if i > 0 and i % change_every == 0:
-                out.append(ExperienceEvent(
-                    day=day, index=0, place="house_a7do",
-                    people_present=["Mum"],
-                    sensory={"touch": "change", "sound": "rustle"},
-                    sounds=["change"],
-                    body_effects={"discomfort": "reduced"},
-                    note="Nappy change routine (~2h)"
-                ))
+        # End with sleep
+        bed = self._bed_sleep_block(day, 0)
+        bed[0].timestamp = bedtime if bedtime is not None else max(wake, asleep_until)
+        out.extend(bed)
         return out
 
     def _bed_sleep_block(self, day: int, idx: int) -> List[ExperienceEvent]:
-        return [
-            ExperienceEvent(
-                day=day, index=idx, place="bedroom_a7do",
-                people_present=["Mum"],
-                sensory={"sound": "quiet", "light": "dark", "touch": "blanket"},
-                sounds=["sleep"],
-                body_effects={"sleep": "onset"},
-                note="Bedtime sleep"
-            )
-        ]
+        return [BED_SLEEP.make(day, idx)]
 
     # -------------------------
     # Helpers
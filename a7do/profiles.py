@@ -1,11 +1,42 @@
 #a7do//profiles.py
 
+from collections.abc import Mapping, MutableMapping
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
-import random
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from a7do.containers import FrozenDict
+from a7do.interaction_ledger import InteractionLedger, InteractionRecord
+from a7do.relationships import RelationshipGraph
+from a7do.versioning import ChangeSet, VersionClock
+
+
+class _Tracked:
+    """
+    Profile base: assigning a field reports the change to the store that
+    holds the profile (TrackedDict / PeopleIndex), so snapshots see it.
+    In-place edits of list / dict fields still need touch().
+    """
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        owner = self.__dict__.get("_owner")
+        if owner is not None:
+            owner[0]._edited(owner[1], self, name)
+
+    def __getstate__(self):
+        # copies and pickles are not in the store
+        state = dict(self.__dict__)
+        state.pop("_owner", None)
+        return state
+
+
+def _adopt(store, key, value):
+    if isinstance(value, _Tracked):
+        object.__setattr__(value, "_owner", (store, key))
+
 
 @dataclass
-class PersonProfile:
+class PersonProfile(_Tracked):
     name: str
     role: str  # mum, dad, sister, neighbour, self
     age: int
@@ -14,13 +45,22 @@ class PersonProfile:
     features: List[str] = field(default_factory=list)
     relationships: Dict[str, List[str]] = field(default_factory=dict)
 
-    def add_relationship(self, rel: str, target: str):
-        self.relationships.setdefault(rel, [])
-        if target not in self.relationships[rel]:
-            self.relationships[rel].append(target)
+    def add_relationship(self, rel: str, target: str) -> bool:
+        """
+        Add self --rel--> target; False if it was already there. A profile
+        held by WorldProfiles.people goes through its relationship graph.
+        """
+        owner = self.__dict__.get("_owner")
+        if owner is not None and getattr(owner[0], "graph", None) is not None:
+            return owner[0]._relate(owner[1], self, rel, target)
+        targets = self.relationships.setdefault(rel, [])
+        if target in targets:
+            return False
+        targets.append(target)
+        return True
 
 @dataclass
-class AnimalProfile:
+class AnimalProfile(_Tracked):
     name: str
     species: str
     temperament: str = "calm"
@@ -28,7 +68,7 @@ class AnimalProfile:
     owner: Optional[str] = None
 
 @dataclass
-class ObjectProfile:
+class ObjectProfile(_Tracked):
     name: str
     category: str  # toy, tool, container, furniture
     colour: Optional[str] = None
@@ -36,106 +76,505 @@ class ObjectProfile:
     affordances: List[str] = field(default_factory=list)
     container_of: Optional[str] = None
 
-@dataclass
-class InteractionRecord:
-    person_name: str
-    last_outcome: str
-    last_day: int
-    encounter_count: int = 0
-    notes: List[str] = field(default_factory=list)
+class TrackedDict(MutableMapping):
+    """
+    Dict that records which keys were set or deleted, and when.
+    Assigning a field of a stored profile is picked up automatically;
+    other in-place edits (e.g. appending to a list field) must be
+    reported with touch(key).
+    """
+
+    def __init__(self, clock: Optional[VersionClock] = None):
+        self.data: Dict[str, Any] = {}
+        self.changes = ChangeSet(clock or VersionClock())
+
+    def touch(self, key):
+        if key in self.data:
+            self.changes.mark(key)
+
+    def _edited(self, key, value, field_name: str = ""):
+        if self.data.get(key) is value:
+            self.changes.mark(key)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for key, value in self.data.items():
+            _adopt(self, key, value)
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __setitem__(self, key, value):
+        self.data[key] = value
+        _adopt(self, key, value)
+        self.changes.mark(key)
+
+    def __delitem__(self, key):
+        del self.data[key]
+        self.changes.drop(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self.data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self):
+        return iter(self.data)
+
+
+def _person_row(p: PersonProfile) -> Dict[str, Any]:
+    return {"role": p.role, "age": p.age, "hair": p.hair, "eyes": p.eyes, "relationships": p.relationships}
+
+
+def _record_row(r: Dict[str, Any]) -> Dict[str, Any]:
+    return {"role": r["role"], "age": r["age"], "hair": r["hair"], "eyes": r["eyes"], "relationships": {}}
+
+
+class PeopleIndex(MutableMapping):
+    """
+    name -> PersonProfile. Explicitly added people live in `local`;
+    generated neighbours stay in the columnar population until looked
+    up, at which point their profile is built and kept in `local`.
+
+    Changes are tracked like TrackedDict; generated neighbours are
+    tracked per door row through the population's born/died versions.
+    """
+
+    def __init__(self, clock: Optional[VersionClock] = None, graph: Optional[RelationshipGraph] = None):
+        self.local: Dict[str, PersonProfile] = {}
+        self.population = None
+        self.changes = ChangeSet(clock or VersionClock())
+        self.graph = graph   # kept in step with each profile's relationships
+        self._shadowed: Set[str] = set()   # population names now held in local
+        self._removed: Set[str] = set()    # population names deleted
+
+    def attach(self, population):
+        self.population = population
+        # Doors may have been regenerated, so names come and go. Shadowing is
+        # recomputed from every local name, not just the previously
+        # shadowed ones: a regenerated door can reproduce a name that was
+        # added locally, and len() must not count that person twice.
+        self._shadowed = {n for n in self.local if population.locate(n) is not None}
+        self._removed = {n for n in self._removed if population.locate(n) is not None}
+
+    def _in_population(self, name: str) -> bool:
+        return (
+            self.population is not None
+            and name not in self._removed
+            and self.population.locate(name) is not None
+        )
+
+    def touch(self, name: str):
+        if name in self:
+            self.changes.mark(name)
+
+    def _edited(self, name: str, profile: PersonProfile, field_name: str = ""):
+        if self.local.get(name) is not profile:
+            return
+        if field_name == "relationships" and self.graph is not None:
+            # a new relationships dict replaces this person's stored edges
+            self.graph.remove_from(name)
+            for rel, targets in profile.relationships.items():
+                self.graph.add_many(rel, ((name, t) for t in targets))
+        self.changes.mark(name)
+
+    def _relate(self, name: str, profile: PersonProfile, rel: str, target: str) -> bool:
+        if self.local.get(name) is not profile:
+            targets = profile.relationships.setdefault(rel, [])
+            if target in targets:
+                return False
+            targets.append(target)
+            return True
+        if not self.graph.add(name, rel, target):
+            return False
+        profile.relationships.setdefault(rel, []).append(target)
+        self.changes.mark(name)
+        return True
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for name, profile in self.local.items():
+            _adopt(self, name, profile)
+
+    def __getitem__(self, name: str) -> PersonProfile:
+        p = self.local.get(name)
+        if p is not None:
+            return p
+        if self._in_population(name):
+            p = self.local[name] = self.population.profile(*self.population.locate(name))
+            _adopt(self, name, p)
+            self._shadowed.add(name)
+            return p
+        raise KeyError(name)
+
+    def _unlink(self, name: str):
+        old = self.local.get(name)
+        if self.graph is not None and old is not None:
+            for rel, targets in old.relationships.items():
+                for t in targets:
+                    self.graph.remove(name, rel, t)
+
+    def __setitem__(self, name: str, profile: PersonProfile):
+        if name not in self.local and self._in_population(name):
+            self._shadowed.add(name)
+        self._unlink(name)
+        self.local[name] = profile
+        _adopt(self, name, profile)
+        if self.graph is not None:
+            for rel, targets in profile.relationships.items():
+                self.graph.add_many(rel, ((name, t) for t in targets))
+        self.changes.mark(name)
+
+    def __delitem__(self, name: str):
+        if name in self.local:
+            self._unlink(name)
+            del self.local[name]
+            if name in self._shadowed:
+                self._shadowed.discard(name)
+                self._removed.add(name)
+        elif self._in_population(name):
+            self._removed.add(name)
+        else:
+            raise KeyError(name)
+        self.changes.drop(name)
+
+    def __contains__(self, name) -> bool:
+        return name in self.local or (isinstance(name, str) and self._in_population(name))
+
+    def __len__(self) -> int:
+        n = len(self.local)
+        if self.population is not None:
+            n += len(self.population) - len(self._shadowed) - len(self._removed)
+        return n
+
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self.local)
+        if self.population is not None:
+            for name in self.population.names():
+                if name not in self.local and name not in self._removed:
+                    yield name
+
+    # Generated family ties, as a derived edge source for the graph
+    @property
+    def edge_rels(self):
+        return self.population.edge_rels if self.population is not None else ()
+
+    def _ties(self, found: frozenset) -> frozenset:
+        return found - self._removed if self._removed and found else found
+
+    def edge_targets(self, name: str, rel: str) -> frozenset:
+        if self.population is None or name in self._removed:
+            return frozenset()
+        return self._ties(self.population.edge_targets(name, rel))
+
+    def edge_sources(self, name: str, rel: str) -> frozenset:
+        if self.population is None or name in self._removed:
+            return frozenset()
+        return self._ties(self.population.edge_sources(name, rel))
+
+    def row(self, name: str) -> Dict[str, Any]:
+        p = self.local.get(name)
+        if p is not None:
+            return _person_row(p)
+        pop = self.population
+        return _record_row(pop.record(*pop.locate(name)))
+
+    def rows(self) -> Iterator[tuple]:
+        """
+        (name, snapshot row) for everyone, without building profiles.
+        """
+        for k, v in self.local.items():
+            yield k, _person_row(v)
+        if self.population is not None:
+            for name, r in self.population.records():
+                if name not in self.local and name not in self._removed:
+                    yield name, _record_row(r)
+
+    def since(self, version: int):
+        """
+        (changed names, removed names) after `version`, generated
+        neighbours included.
+        """
+        changed, removed = self.changes.since(version)
+        pop = self.population
+        if pop is not None:
+            seen = set(changed)
+            changed += [
+                n for n in pop.names(pop.born_since(version))
+                if n not in seen and n not in self._removed
+            ]
+            already = set(removed)
+            removed += [n for n in pop.names(pop.died_since(version)) if n not in self and n not in already]
+        return changed, removed
+
+
+class NeighbourFamilies(MutableMapping):
+    """
+    door -> family dict. Generated families are read-only views built
+    from the neighbour population; assigning a door stores a plain dict
+    that takes precedence.
+
+    `version` counts changes (assign / delete a door, new population);
+    edit a stored family dict by assigning the door again.
+    """
+
+    def __init__(self):
+        self.local: Dict[Any, Dict[str, str]] = {}
+        self.population = None
+        self.version = 0
+        self._snapshot: Optional["FamilySnapshot"] = None
+
+    def attach(self, population):
+        self.population = population
+        for door in [d for d in self.local if population.has_door(d)]:
+            del self.local[door]
+        self.version += 1
+
+    def snapshot(self) -> "FamilySnapshot":
+        """
+        Read-only door -> family mapping as of now. Cached until the
+        next change, so repeated calls are free.
+        """
+        snap = self._snapshot
+        if snap is None or snap.version != self.version:
+            snap = self._snapshot = FamilySnapshot(self)
+        return snap
+
+    def __getitem__(self, door) -> Dict[str, str]:
+        fam = self.local.get(door)
+        if fam is not None:
+            return fam
+        if self.population is not None and self.population.has_door(door):
+            return self.population.family(door)
+        raise KeyError(door)
+
+    def __setitem__(self, door, fam: Dict[str, str]):
+        self.local[door] = fam
+        self.version += 1
+
+    def __delitem__(self, door):
+        if door in self.local:
+            del self.local[door]
+            self.version += 1
+        else:
+            raise KeyError(door)
+
+    def __len__(self) -> int:
+        n = len(self.local)
+        if self.population is not None:
+            n += self.population.door_count - sum(1 for d in self.local if self.population.has_door(d))
+        return n
+
+    def __iter__(self) -> Iterator[Any]:
+        yield from list(self.local)
+        if self.population is not None:
+            for door in self.population.live_doors():
+                if door not in self.local:
+                    yield door
+
+
+class FamilySnapshot(Mapping):
+    """
+    Frozen door -> family view of NeighbourFamilies at one version.
+    Holds the door list and copies of assigned families; generated
+    families are read from the population on lookup. The population is
+    only extended by generate_neighbours, which moves the version on,
+    so a snapshot stays valid until its owner changes.
+    """
+
+    def __init__(self, families: NeighbourFamilies):
+        self.version = families.version
+        self.population = families.population
+        self.local = {door: FrozenDict(fam) for door, fam in families.local.items()}
+        self.doors = tuple(families)
+        self._doors = set(self.doors)
+
+    def __getitem__(self, door) -> Dict[str, str]:
+        fam = self.local.get(door)
+        if fam is not None:
+            return fam
+        if door not in self._doors:
+            raise KeyError(door)
+        return self.population.family(door)
+
+    def __contains__(self, door) -> bool:
+        return door in self._doors
+
+    def __len__(self) -> int:
+        return len(self.doors)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.doors)
+
+    def __getstate__(self):
+        # the door set is rebuilt on load
+        state = dict(self.__dict__)
+        del state["_doors"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._doors = set(self.doors)
+
 
 class WorldProfiles:
     """
     Observer-defined entities (allowed reality).
     """
     def __init__(self):
-        self.people: Dict[str, PersonProfile] = {}
-        self.animals: Dict[str, AnimalProfile] = {}
-        self.objects: Dict[str, ObjectProfile] = {}
+        self.clock = VersionClock()
+        self.relationships = RelationshipGraph()
+        self.people = PeopleIndex(self.clock, self.relationships)
+        self.relationships.derived = self.people   # generated family ties
+        self.animals = TrackedDict(self.clock)        # name -> AnimalProfile
+        self.objects = TrackedDict(self.clock)        # name -> ObjectProfile
         self.parent_knowledge: Dict[str, List[str]] = {}
-        self.interactions: Dict[str, InteractionRecord] = {}
-        self.neighbour_families: Dict[str, Dict[str, str]] = {}
+        self.interactions = InteractionLedger(self.clock)   # person -> InteractionRecord view
+        self.neighbour_families = NeighbourFamilies()
+        self._snap: Optional[Dict[str, Any]] = None
+
+    @property
+    def version(self) -> int:
+        return self.clock.version
+
+    def touch(self, section: str, key: str):
+        """
+        Report an in-place edit of a stored profile's list / dict field
+        (e.g. features.append) so the next snapshot picks it up. Plain
+        field assignments (people["Dad"].age = 40) are tracked already.
+        """
+        getattr(self, section).touch(key)
 
     def has_parents(self) -> bool:
-        roles = {p.role.lower() for p in self.people.values()}
+        # neighbours are never mum/dad, so only explicitly added people count
+        roles = {p.role.lower() for p in self.people.local.values()}
         return ("mum" in roles) and ("dad" in roles)
 
+    def relate(self, src: str, rel: str, dst: str) -> bool:
+        """
+        Record src --rel--> dst in the relationship graph, and on src's
+        PersonProfile when src is a person. False if it already existed.
+        """
+        if src in self.people:
+            return self.people[src].add_relationship(rel, dst)
+        return self.relationships.add(src, rel, dst)
+
+    def unrelate(self, src: str, rel: str, dst: str) -> bool:
+        if not self.relationships.remove(src, rel, dst):
+            return False
+        p = self.people.local.get(src)
+        if p is not None and dst in p.relationships.get(rel, ()):
+            p.relationships[rel].remove(dst)
+            if not p.relationships[rel]:
+                del p.relationships[rel]
+            self.people.touch(src)
+        return True
+
+    def related(self, name: str, rel: str) -> Set[str]:
+        """Who `name` has as `rel` (e.g. Mum's pets)."""
+        return self.relationships.targets(name, rel)
+
+    def related_to(self, name: str, rel: str) -> Set[str]:
+        """Who has `name` as `rel` (e.g. whose pet Rex is)."""
+        return self.relationships.sources(name, rel)
+
     def assign_pet(self, pet_name: str, owner_name: str):
         if pet_name in self.animals and owner_name in self.people:
             self.animals[pet_name].owner = owner_name
-            self.people[owner_name].add_relationship("pet", pet_name)
+            self.relate(owner_name, "pet", pet_name)
 
     def set_interaction(self, person_name: str, outcome: str, day: int, notes: Optional[List[str]] = None):
-        notes = notes or []
-        rec = self.interactions.get(person_name)
-        if rec is None:
-            rec = InteractionRecord(person_name=person_name, last_outcome=outcome, last_day=day, encounter_count=1, notes=notes)
-        else:
-            rec.last_outcome = outcome
-            rec.last_day = day
-            rec.encounter_count += 1
-            rec.notes.extend(notes)
-        self.interactions[person_name] = rec
+        self.interactions.append(person_name, outcome, day, notes)
+
+    def family_members(self, door) -> List[str]:
+        """
+        Names of the real people in a neighbour family (no placeholder cards).
+        """
+        fam = self.neighbour_families.get(door) or {}
+        return [v for k, v in fam.items() if k != "style" and not v.startswith("unknown_")]
+
+    def family_encounters(self, door, start_day: Optional[int] = None, end_day: Optional[int] = None) -> int:
+        """
+        Encounters with anyone from door's family in [start_day, end_day].
+        """
+        return self.interactions.encounters(self.family_members(door), start_day, end_day)
 
     def generate_neighbours(self, seed: int, door_numbers: List[str]):
-        rng = random.Random(seed)
-
-        first_names_m = ["James", "Craig", "Tom", "Mark", "Owen", "Liam", "Noah", "Leo", "Finn", "Alex"]
-        first_names_f = ["Sarah", "Mags", "Emma", "Sophie", "Zoe", "Ava", "Mia", "Ella", "Grace", "Lucy"]
-        hair = ["brown", "blonde", "black", "red", "grey"]
-        eyes = ["blue", "green", "brown", "hazel"]
-
-        specials = rng.sample(door_numbers, k=min(3, len(door_numbers)))
-        special_map = {}
-        if len(specials) >= 1: special_map[specials[0]] = "single_mum"
-        if len(specials) >= 2: special_map[specials[1]] = "single_dad"
-        if len(specials) >= 3: special_map[specials[2]] = "blended"
-
-        for door in door_numbers:
-            style = special_map.get(door, "standard")
-
-            dad_name = f"{rng.choice(first_names_m)}_{door}_Dad"
-            mum_name = f"{rng.choice(first_names_f)}_{door}_Mum"
-            c1 = f"{rng.choice(first_names_m)}_{door}_Boy"
-            c2 = f"{rng.choice(first_names_f)}_{door}_Girl"
-
-            fam = {"style": style}
-
-            if style == "single_mum":
-                self.people[mum_name] = PersonProfile(mum_name, "neighbour_mum", rng.randint(24, 45), rng.choice(hair), rng.choice(eyes), ["tired smile"])
-                self.people[c1] = PersonProfile(c1, "neighbour_child", rng.randint(4, 10), rng.choice(hair), rng.choice(eyes), [])
-                self.people[c2] = PersonProfile(c2, "neighbour_child", rng.randint(4, 10), rng.choice(hair), rng.choice(eyes), [])
-                fam.update({"mum": mum_name, "dad": "unknown_dad_card", "child1": c1, "child2": c2})
-
-            elif style == "single_dad":
-                self.people[dad_name] = PersonProfile(dad_name, "neighbour_dad", rng.randint(24, 45), rng.choice(hair), rng.choice(eyes), ["gentle voice"])
-                self.people[c1] = PersonProfile(c1, "neighbour_child", rng.randint(4, 10), rng.choice(hair), rng.choice(eyes), [])
-                self.people[c2] = PersonProfile(c2, "neighbour_child", rng.randint(4, 10), rng.choice(hair), rng.choice(eyes), [])
-                fam.update({"dad": dad_name, "mum": "unknown_mum_card", "child1": c1, "child2": c2})
-
-            elif style == "blended":
-                step_dad = f"{rng.choice(first_names_m)}_{door}_StepDad"
-                bio_dad = f"{rng.choice(first_names_m)}_{door}_BioDad"
-                self.people[mum_name] = PersonProfile(mum_name, "neighbour_mum", rng.randint(24, 45), rng.choice(hair), rng.choice(eyes), ["confident"])
-                self.people[step_dad] = PersonProfile(step_dad, "neighbour_stepdad", rng.randint(24, 50), rng.choice(hair), rng.choice(eyes), ["friendly"])
-                self.people[c1] = PersonProfile(c1, "neighbour_child", rng.randint(4, 10), rng.choice(hair), rng.choice(eyes), [])
-                self.people[c2] = PersonProfile(c2, "neighbour_child", rng.randint(4, 10), rng.choice(hair), rng.choice(eyes), [])
-                fam.update({"mum": mum_name, "stepdad": step_dad, "biodad": bio_dad, "child1": c1, "child2": c2})
-
-            else:
-                self.people[dad_name] = PersonProfile(dad_name, "neighbour_dad", rng.randint(24, 50), rng.choice(hair), rng.choice(eyes), ["hello wave"])
-                self.people[mum_name] = PersonProfile(mum_name, "neighbour_mum", rng.randint(24, 50), rng.choice(hair), rng.choice(eyes), ["warm smile"])
-                self.people[c1] = PersonProfile(c1, "neighbour_child", rng.randint(4, 10), rng.choice(hair), rng.choice(eyes), [])
-                self.people[c2] = PersonProfile(c2, "neighbour_child", rng.randint(4, 10), rng.choice(hair), rng.choice(eyes), [])
-                fam.update({"dad": dad_name, "mum": mum_name, "child1": c1, "child2": c2})
-
-            self.neighbour_families[door] = fam
-
-    def snapshot(self):
-        return {
-            "people": {k: {"role": v.role, "age": v.age, "hair": v.hair, "eyes": v.eyes, "relationships": v.relationships} for k, v in self.people.items()},
-            "animals": {k: {"species": v.species, "owner": v.owner} for k, v in self.animals.items()},
-            "objects": {k: {"category": v.category, "colour": v.colour, "shape": v.shape, "affordances": v.affordances} for k, v in self.objects.items()},
-            "interactions": {k: {"last_outcome": v.last_outcome, "last_day": v.last_day, "encounters": v.encounter_count} for k, v in self.interactions.items()},
-            "neighbour_families_count": len(self.neighbour_families),
-        }
\ No newline at end of file
+        """
+        Generate a family per door into the columnar neighbour store.
+        Profiles and family dicts are only built when looked up. Family
+        ties (parent / partner / sibling) are answered by the relationship
+        graph straight from the store; they are not copied into each
+        PersonProfile.relationships, which lists explicit ties only.
+        """
+        from a7do.neighbourhood import NeighbourPopulation
+
+        pop = self.people.population
+        if pop is None:
+            pop = NeighbourPopulation()
+        pop.extend(seed, door_numbers, version=self.clock.bump())
+        self.people.attach(pop)
+        self.neighbour_families.attach(pop)
+
+    _ROWS = {
+        "animals": lambda v: {"species": v.species, "owner": v.owner},
+        "objects": lambda v: {"category": v.category, "colour": v.colour, "shape": v.shape, "affordances": v.affordances},
+        "interactions": lambda v: {"last_outcome": v.last_outcome, "last_day": v.last_day, "encounters": v.encounter_count},
+    }
+
+    def _section_since(self, section: str, version: int):
+        store = getattr(self, section)
+        if section == "people":
+            changed, removed = store.since(version)
+            return {k: store.row(k) for k in changed if k in store}, removed
+        changed, removed = store.changes.since(version)
+        row = self._ROWS[section]
+        return {k: row(store[k]) for k in changed}, removed
+
+    def snapshot(self, since: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Full snapshot, or with `since` only what changed after that
+        version: {section: {key: row}} plus "removed": {section: [keys]}.
+        Both carry "version", the clock value they reflect, to pass back
+        as `since` next time.
+
+        The full snapshot is cached and brought up to date from deltas;
+        callers share it, so treat it as read-only. Assigning a profile
+        field bumps the version; edits inside a list / dict field (e.g.
+        people["Dad"].features.append(...)) must be reported with
+        touch(section, key) or the cached snapshot will not show them.
+        """
+        if since is not None:
+            out: Dict[str, Any] = {"version": self.version, "since": since, "removed": {}}
+            for section in ("people", "animals", "objects", "interactions"):
+                out[section], out["removed"][section] = self._section_since(section, since)
+            out["neighbour_families_count"] = len(self.neighbour_families)
+            return out
+
+        snap = self._snap
+        if snap is not None and snap["version"] == self.version:
+            return snap
+
+        if snap is None:
+            snap = {
+                "version": self.version,
+                "people": dict(self.people.rows()),
+                "animals": {k: self._ROWS["animals"](v) for k, v in self.animals.items()},
+                "objects": {k: self._ROWS["objects"](v) for k, v in self.objects.items()},
+                "interactions": {k: self._ROWS["interactions"](v) for k, v in self.interactions.items()},
+                "neighbour_families_count": len(self.neighbour_families),
+            }
+        else:
+            delta = self.snapshot(since=snap["version"])
+            snap = dict(snap, version=delta["version"], neighbour_families_count=delta["neighbour_families_count"])
+            for section in ("people", "animals", "objects", "interactions"):
+                changed, removed = delta[section], delta["removed"][section]
+                if changed or removed:
+                    rows = dict(snap[section])   # previous snapshots stay as they were
+                    for k in removed:
+                        rows.pop(k, None)
+                    rows.update(changed)
+                    snap[section] = rows
+        self._snap = snap
+        return snap
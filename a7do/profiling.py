@@ -0,0 +1,39 @@
+# a7do/profiling.py
+from __future__ import annotations
+
+from typing import Dict
+
+
+class StageTimer:
+    """
+    Timing hook that accumulates seconds and event counts per stage.
+    Pass an instance wherever an `on_stage(stage, seconds, n_events)`
+    callback is accepted.
+    """
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+        self.events: Dict[str, int] = {}
+        self.calls: Dict[str, int] = {}
+
+    def __call__(self, stage: str, seconds: float, n_events: int):
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+        self.events[stage] = self.events.get(stage, 0) + n_events
+        self.calls[stage] = self.calls.get(stage, 0) + 1
+
+    def reset(self):
+        self.seconds.clear()
+        self.events.clear()
+        self.calls.clear()
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        total = sum(self.seconds.values()) or 1.0
+        return {
+            stage: {
+                "seconds": round(sec, 6),
+                "share": round(sec / total, 3),
+                "events": self.events[stage],
+                "us_per_event": round(1e6 * sec / self.events[stage], 3) if self.events[stage] else 0.0,
+            }
+            for stage, sec in sorted(self.seconds.items(), key=lambda kv: -kv[1])
+        }
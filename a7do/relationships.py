@@ -0,0 +1,184 @@
+# a7do/relationships.py
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+_EMPTY: frozenset = frozenset()
+
+
+class RelationshipGraph:
+    """
+    Typed, directed relationship edges (src --rel--> dst) with forward
+    and reverse adjacency sets per relation type:
+
+        out[rel][src] = {dst, ...}      "who is Mum's pet?"
+        inc[rel][dst] = {src, ...}      "who has Rex as a pet?"
+
+    Adding, removing and testing an edge are O(1); neighbourhood() walks
+    k hops breadth-first over any subset of relation types.
+
+    Edges that follow from other data (e.g. generated neighbour families)
+    can come from an attached `derived` source instead of being stored:
+    it answers edge_targets(src, rel), edge_sources(dst, rel) and lists
+    its relation types in edge_rels. Lookups and neighbourhood() include
+    those edges; add / remove and edge_count cover stored edges only.
+    """
+
+    def __init__(self):
+        self.out: Dict[str, Dict[str, Set[str]]] = {}
+        self.inc: Dict[str, Dict[str, Set[str]]] = {}
+        self.edge_count = 0
+        self.derived = None
+
+    # =========================
+    # Editing
+    # =========================
+
+    def add(self, src: str, rel: str, dst: str) -> bool:
+        """
+        Add an edge; False if it was already there.
+        """
+        targets = self.out.setdefault(rel, {}).setdefault(src, set())
+        if dst in targets:
+            return False
+        targets.add(dst)
+        self.inc.setdefault(rel, {}).setdefault(dst, set()).add(src)
+        self.edge_count += 1
+        return True
+
+    def add_many(self, rel: str, pairs: Iterable[Tuple[str, str]]) -> int:
+        """
+        Bulk add (src, dst) pairs of one relation type; returns how many were new.
+        """
+        out = self.out.setdefault(rel, {})
+        inc = self.inc.setdefault(rel, {})
+        added = 0
+        for src, dst in pairs:
+            targets = out.get(src)
+            if targets is None:
+                targets = out[src] = set()
+            elif dst in targets:
+                continue
+            targets.add(dst)
+            sources = inc.get(dst)
+            if sources is None:
+                sources = inc[dst] = set()
+            sources.add(src)
+            added += 1
+        self.edge_count += added
+        return added
+
+    def remove(self, src: str, rel: str, dst: str) -> bool:
+        targets = self.out.get(rel, {}).get(src)
+        if not targets or dst not in targets:
+            return False
+        targets.discard(dst)
+        if not targets:
+            del self.out[rel][src]
+        sources = self.inc[rel][dst]
+        sources.discard(src)
+        if not sources:
+            del self.inc[rel][dst]
+        self.edge_count -= 1
+        return True
+
+    def remove_from(self, src: str) -> int:
+        """
+        Drop every stored edge leaving `src`; returns how many went.
+        """
+        edges = [(src, rel, dst) for rel, adj in self.out.items() for dst in adj.get(src, _EMPTY)]
+        return sum(self.remove(*e) for e in edges)
+
+    def remove_node(self, node: str) -> int:
+        """
+        Drop every stored edge touching `node`; returns how many went.
+        """
+        edges = [(node, rel, dst) for rel, adj in self.out.items() for dst in adj.get(node, _EMPTY)]
+        edges += [(src, rel, node) for rel, adj in self.inc.items() for src in adj.get(node, _EMPTY)]
+        return sum(self.remove(*e) for e in edges)
+
+    # =========================
+    # Lookup
+    # =========================
+
+    def _rels(self) -> List[str]:
+        rels = list(self.out)
+        if self.derived is not None:
+            rels += [r for r in self.derived.edge_rels if r not in self.out]
+        return rels
+
+    def has(self, src: str, rel: str, dst: str) -> bool:
+        return dst in self.targets(src, rel)
+
+    def targets(self, src: str, rel: str) -> Set[str]:
+        """
+        dst for every src --rel--> dst (read-only view; do not mutate).
+        """
+        stored = self.out.get(rel, {}).get(src, _EMPTY)
+        extra = self.derived.edge_targets(src, rel) if self.derived is not None else _EMPTY
+        return stored | extra if extra else stored
+
+    def sources(self, dst: str, rel: str) -> Set[str]:
+        """
+        src for every src --rel--> dst (read-only view; do not mutate).
+        """
+        stored = self.inc.get(rel, {}).get(dst, _EMPTY)
+        extra = self.derived.edge_sources(dst, rel) if self.derived is not None else _EMPTY
+        return stored | extra if extra else stored
+
+    def edges_from(self, src: str) -> Iterator[Tuple[str, str]]:
+        for rel in self._rels():
+            for dst in self.targets(src, rel):
+                yield rel, dst
+
+    def edges_to(self, dst: str) -> Iterator[Tuple[str, str]]:
+        for rel in self._rels():
+            for src in self.sources(dst, rel):
+                yield rel, src
+
+    def relations_of(self, src: str) -> Dict[str, List[str]]:
+        """
+        Outgoing edges in PersonProfile.relationships form.
+        """
+        out: Dict[str, List[str]] = {}
+        for rel, dst in self.edges_from(src):
+            out.setdefault(rel, []).append(dst)
+        return out
+
+    def neighbourhood(
+        self,
+        node: str,
+        k: int = 1,
+        rels: Optional[Iterable[str]] = None,
+        direction: str = "both",
+    ) -> Dict[str, int]:
+        """
+        Nodes within k hops of `node` -> hop distance (node itself excluded).
+        direction: "out" follows src->dst, "in" dst->src, "both" either.
+        """
+        rels = self._rels() if rels is None else list(rels)
+        steps = []
+        if direction in ("out", "both"):
+            steps += [(self.targets, r) for r in rels]
+        if direction in ("in", "both"):
+            steps += [(self.sources, r) for r in rels]
+
+        dist = {node: 0}
+        frontier = [node]
+        for hop in range(1, k + 1):
+            nxt = []
+            for n in frontier:
+                for step, rel in steps:
+                    for m in step(n, rel):
+                        if m not in dist:
+                            dist[m] = hop
+                            nxt.append(m)
+            if not nxt:
+                break
+            frontier = nxt
+        del dist[node]
+        return dist
+
+    def __len__(self) -> int:
+        return self.edge_count
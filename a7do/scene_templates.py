@@ -0,0 +1,72 @@
+# a7do/scene_templates.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from a7do.containers import FrozenDict, FrozenList
+from a7do.events import ExperienceEvent
+
+
+@dataclass(frozen=True)
+class SceneTemplate:
+    """
+    Immutable scene payload. Each event made from it gets its own plain
+    dict / list copies of these containers (the strings inside stay
+    shared), so events can be edited freely and the template cannot.
+    """
+    name: str
+    place: str
+    people_present: FrozenList
+    sensory: FrozenDict
+    sounds: FrozenList
+    body_effects: FrozenDict
+    note: str
+    movement: Optional[FrozenDict] = None
+
+    def make(self, day: int, index: int = 0, place: Optional[str] = None, note: Optional[str] = None) -> ExperienceEvent:
+        return ExperienceEvent(
+            day=day,
+            index=index,
+            place=self.place if place is None else place,
+            people_present=list(self.people_present),
+            movement=None if self.movement is None else dict(self.movement),
+            sensory=dict(self.sensory),
+            sounds=list(self.sounds),
+            body_effects=dict(self.body_effects),
+            note=self.note if note is None else note,
+        )
+
+
+SCENES: Dict[str, SceneTemplate] = {}
+
+
+def register_scene(
+    name: str,
+    place: str,
+    people_present: List[str],
+    sensory: Dict[str, Any],
+    sounds: List[str],
+    body_effects: Optional[Dict[str, Any]] = None,
+    note: str = "",
+    movement: Optional[Dict[str, Any]] = None,
+) -> SceneTemplate:
+    """
+    Freeze a scene payload and register it under `name`.
+    """
+    tpl = SceneTemplate(
+        name=name,
+        place=place,
+        people_present=FrozenList(people_present or ()),
+        sensory=FrozenDict(sensory or {}),
+        sounds=FrozenList(sounds or ()),
+        body_effects=FrozenDict(body_effects or {}),
+        note=note,
+        movement=FrozenDict(movement) if movement else None,
+    )
+    SCENES[name] = tpl
+    return tpl
+
+
+def scene(name: str) -> SceneTemplate:
+    return SCENES[name]
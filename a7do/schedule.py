@@ -1,7 +1,8 @@
 # a7do/schedule.py
 from __future__ import annotations
-from typing import List, Optional, Dict, Any
+from typing import Iterable, Iterator, Optional, Dict, Any
 from a7do.events import ExperienceEvent
+from a7do.movement_log import MovementLog
 
 
 class Schedule:
@@ -13,17 +14,23 @@ class Schedule:
     def __init__(self):
         self.day: int = 0
         self.state: str = "sleeping"  # sleeping | awake
-        self.events: List[ExperienceEvent] = []
+        self.events: Iterable[ExperienceEvent] = []   # as loaded; never copied
+        self._pending: Iterator[ExperienceEvent] = iter(())
         self.index: int = 0
 
         self.current_place: str = "hospital"
         self.current_room: str = "ward"
 
-        self.movements: List[Dict[str, Any]] = []  # A7DO movement log (observer-visible)
+        self.movements = MovementLog("A7DO")  # A7DO movement log (observer-visible)
 
-    def load(self, day: int, events: List[ExperienceEvent], start_place: str, start_room: str):
+    def load(self, day: int, events: Iterable[ExperienceEvent], start_place: str, start_room: str):
+        """
+        Load a day's events: a list, or any iterator/generator
+        (e.g. CaregiverFlow.iter_day), which is pulled lazily.
+        """
         self.day = day
-        self.events = list(events)
+        self.events = events
+        self._pending = iter(events)
         self.index = 0
         self.current_place = start_place
         self.current_room = start_room
@@ -35,27 +42,24 @@ class Schedule:
     def next_event(self) -> Optional[ExperienceEvent]:
         if self.state != "awake":
             return None
-        if self.index >= len(self.events):
+        ev = next(self._pending, None)
+        if ev is None:
             return None
-        ev = self.events[self.index]
         self.index += 1
 
         # Track movement if present
         mv = ev.movement or {}
         if mv.get("from") and mv.get("to"):
-            self.movements.append({
-                "day": self.day,
-                "event": self.index,
-                "actor": "A7DO",
-                "from": mv["from"],
-                "to": mv["to"]
-            })
+            self.movements.append(self.day, self.index, mv["from"], mv["to"])
             self.current_place = mv["to"]
             self.current_room = ev.room or self.current_room
         else:
             self.current_place = ev.place_id or self.current_place
             self.current_room = ev.room or self.current_room
 
+        # One event's worth of dwell at wherever A7DO now is
+        self.movements.accrue(self.day, self.current_place)
+
         return ev
 
     def end_day_enforced(self):
@@ -72,7 +76,7 @@ class Schedule:
             "day": self.day,
             "state": self.state,
             "event_index": self.index,
-            "events_total": len(self.events),
+            "events_total": len(self.events) if hasattr(self.events, "__len__") else None,
             "current_place": self.current_place,
             "current_room": self.current_room,
             "movements": len(self.movements),
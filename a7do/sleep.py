@@ -1,30 +1,64 @@
 #a7do/sleep.py
 
-from collections import defaultdict
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+from a7do.cooccurrence import CooccurrenceGraph
+
 
 class SleepEngine:
-    def replay(self, events: List[Any]) -> Dict[str, Any]:
-        recent = events[-12:]
-        edges = defaultdict(int)
-
-        for ev in recent:
-            a = f"agent:{ev.agent}"
-            p = f"place:{ev.place_id}"
-            r = f"room:{ev.room}"
-            edges[(a, p)] += 1
-            edges[(a, r)] += 1
-            edges[(p, r)] += 1
-            if ev.obj:
-                o = f"obj:{ev.obj}"
-                edges[(a, o)] += 1
-                edges[(o, p)] += 1
-            for pr in getattr(ev, "presence", []) or []:
-                edges[(a, f"present:{pr}")] += 1
-
-        top = sorted(edges.items(), key=lambda kv: kv[1], reverse=True)[:20]
+    """
+    Sleep replay over a persistent co-occurrence graph.
+    Each night only events not yet replayed are added, at most the last
+    `window` of them (12, as before; None replays all new events).
+    Weights carry across nights, optionally decayed by `decay` before
+    each replay.
+    """
+
+    def __init__(self, decay: Optional[float] = None, top_k: int = 20, window: Optional[int] = 12):
+        self.graph = CooccurrenceGraph()
+        self.decay = decay
+        self.top_k = top_k
+        self.window = window
+
+        self.cursor = 0   # history position of the first event not yet replayed
+
+    def _add_event(self, ev):
+        g = self.graph
+        a = f"agent:{ev.agent}"
+        p = f"place:{ev.place_id}"
+        r = f"room:{ev.room}"
+        g.add(a, p)
+        g.add(a, r)
+        g.add(p, r)
+        if ev.obj:
+            o = f"obj:{ev.obj}"
+            g.add(a, o)
+            g.add(o, p)
+        for pr in getattr(ev, "presence", []) or []:
+            g.add(a, f"present:{pr}")
+
+    def replay(self, events: List[Any], start: int = 0) -> Dict[str, Any]:
+        """
+        `events` hold history positions start .. start + len(events) - 1:
+        pass the whole history (start=0), a copy of it, or only the new
+        tail with its starting position. Positions before `cursor` were
+        already replayed and are skipped.
+        """
+        end = start + len(events)
+        lo = max(self.cursor, start)
+        if self.window is not None:
+            lo = max(lo, end - self.window)
+        new = events[lo - start:] if lo < end else []
+        self.cursor = max(self.cursor, end)
+
+        if self.decay is not None:
+            self.graph.decay(self.decay)
+        for ev in new:
+            self._add_event(ev)
+
+        top = self.graph.top(self.top_k)
         return {
-            "replayed_count": len(recent),
-            "top_edges": [{"a": k[0], "b": k[1], "w": v} for k, v in top],
+            "replayed_count": len(new),
+            "top_edges": [{"a": a, "b": b, "w": int(w) if float(w).is_integer() else round(w, 4)} for a, b, w in top],
             "note": "Replay reinforces co-occurrence only."
-        }
\ No newline at end of file
+        }
@@ -1,34 +1,93 @@
 # a7do/somatic.py
 
+from typing import Dict, Iterable, Optional
+
+DEFAULT_ZONES = (
+    "head", "face", "neck",
+    "chest", "back", "abdomen",
+    "left_arm", "right_arm",
+    "left_hand", "right_hand",
+    "left_leg", "right_leg",
+    "left_foot", "right_foot",
+)
+
+DECAY_STEP = 0.05
+
+
 class SomaticState:
     """
     Somatic (body surface) state. Maps where sensation occurs.
+
+    Decay is lazy: a touched zone remembers its value and the tick it was
+    last written, and the decayed value is worked out when read. Only
+    zones with sensation above zero are tracked, so decay() is O(1) and
+    snapshot() is O(active zones) whatever the size of the zone map.
     """
 
-    def __init__(self):
-        self.zones = {
-            "head": 0.0, "face": 0.0, "neck": 0.0,
-            "chest": 0.0, "back": 0.0, "abdomen": 0.0,
-            "left_arm": 0.0, "right_arm": 0.0,
-            "left_hand": 0.0, "right_hand": 0.0,
-            "left_leg": 0.0, "right_leg": 0.0,
-            "left_foot": 0.0, "right_foot": 0.0,
-        }
+    def __init__(self, zones: Optional[Iterable[str]] = None):
+        names = DEFAULT_ZONES if zones is None else zones
+        self._order: Dict[str, int] = {name: i for i, name in enumerate(names)}
+
+        self.tick = 0                       # decay steps applied so far
+        self._value: Dict[str, float] = {}  # active zone -> value at its stamp
+        self._stamp: Dict[str, int] = {}    # active zone -> tick of last write
+        self._snap: Optional[dict] = None   # cached snapshot
+
+    def _read(self, zone: str) -> float:
+        v = self._value.get(zone)
+        if v is None:
+            return 0.0
+        # Replay the eager per-tick subtraction so values match it exactly;
+        # at most 1 / DECAY_STEP steps before reaching zero.
+        steps = self.tick - self._stamp[zone]
+        while steps > 0 and v > 0.0:
+            v = max(0.0, v - DECAY_STEP)
+            steps -= 1
+        return v
+
+    def _write(self, zone: str, v: float):
+        if v > 0.0:
+            self._value[zone] = v
+            self._stamp[zone] = self.tick
+        else:
+            self._value.pop(zone, None)
+            self._stamp.pop(zone, None)
+        self._snap = None
+
+    def get(self, zone: str) -> float:
+        return self._read(zone)
 
     def apply_touch(self, zone: str, intensity: float = 0.2):
-        if zone in self.zones:
-            self.zones[zone] = min(1.0, self.zones[zone] + intensity)
+        if zone in self._order:
+            self._write(zone, min(1.0, self._read(zone) + intensity))
 
     def apply_pain(self, zone: str, intensity: float = 0.4):
-        if zone in self.zones:
-            self.zones[zone] = min(1.0, self.zones[zone] + intensity)
+        if zone in self._order:
+            self._write(zone, min(1.0, self._read(zone) + intensity))
 
     def decay(self):
-        for k in self.zones:
-            self.zones[k] = max(0.0, self.zones[k] - 0.05)
+        self.tick += 1
+        if self._value:
+            self._snap = None
+
+    @property
+    def zones(self) -> Dict[str, float]:
+        """
+        Full zone map (O(zones)); kept for callers that read it directly.
+        """
+        return {k: self._read(k) for k in self._order}
 
     def snapshot(self) -> dict:
-        return {k: round(v, 3) for k, v in self.zones.items() if v > 0.0}
+        if self._snap is None:
+            snap = {}
+            for k in sorted(self._value, key=self._order.__getitem__):
+                v = self._read(k)
+                if v > 0.0:
+                    snap[k] = round(v, 3)
+                else:
+                    self._write(k, 0.0)
+            self._snap = snap
+        return dict(self._snap)
 
 
-SomaticMap = SomaticState  # compatibility alias
\ No newline at end of file
+SomaticMap = SomaticState  # compatibility alias
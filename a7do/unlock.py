@@ -0,0 +1,178 @@
+# a7do/unlock.py
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from a7do.future_paths import FuturePath, FuturePathRegistry
+
+
+_TOP = "\uffff"   # sorts after any path id
+
+
+def _order(paths: Iterable[FuturePath]) -> List[FuturePath]:
+    return sorted(paths, key=lambda p: (-p.priority, p.created_at))
+
+
+class UnlockEvaluator:
+    """
+    Evaluates FuturePath unlock conditions against the current state,
+    re-checking only the paths a change can affect.
+
+    Supported conditions (unknown keys are ignored):
+      min_day      day >= min_day        sorted index on min_day
+      max_cry      cry <= max_cry        sorted index on max_cry
+      place        current place match   place -> paths
+      min_lexicon  {word: n}, count >= n word -> sorted (n, path)
+
+    Each setter returns the paths that became eligible because of that
+    change, highest priority first.
+    """
+
+    def __init__(self, day: int = 0, cry: float = 0.0, place: Optional[str] = None):
+        self.day = day
+        self.cry = cry
+        self.place = place
+        self.words: Dict[str, int] = {}
+
+        self.paths: Dict[str, FuturePath] = {}
+        self.eligible_ids: Set[str] = set()
+
+        self._min_day: List[Tuple[float, str]] = []
+        self._max_cry: List[Tuple[float, str]] = []
+        self._place: Dict[str, Set[str]] = {}
+        self._lexicon: Dict[str, List[Tuple[int, str]]] = {}
+
+    # =========================
+    # Indexing
+    # =========================
+
+    def attach(self, registry: FuturePathRegistry):
+        """
+        Index every path in the registry and every path proposed later.
+        """
+        for p in registry.paths.values():
+            self.add(p)
+        registry.subscribe(self.add)
+
+    def add(self, path: FuturePath):
+        pid = path.path_id
+        if pid in self.paths:
+            return
+        self.paths[pid] = path
+        u = path.unlock or {}
+
+        if "min_day" in u:
+            insort(self._min_day, (u["min_day"], pid))
+        if "max_cry" in u:
+            insort(self._max_cry, (u["max_cry"], pid))
+        if "place" in u:
+            self._place.setdefault(u["place"], set()).add(pid)
+        for word, n in (u.get("min_lexicon") or {}).items():
+            insort(self._lexicon.setdefault(word, []), (n, pid))
+
+        if self._check(path):
+            self.eligible_ids.add(pid)
+
+    def _check(self, path: FuturePath) -> bool:
+        u = path.unlock or {}
+        if "min_day" in u and self.day < u["min_day"]:
+            return False
+        if "max_cry" in u and self.cry > u["max_cry"]:
+            return False
+        if "place" in u and self.place != u["place"]:
+            return False
+        for word, n in (u.get("min_lexicon") or {}).items():
+            if self.words.get(word, 0) < n:
+                return False
+        return True
+
+    def _recheck(self, pids: Iterable[str]) -> List[FuturePath]:
+        newly = []
+        for pid in set(pids):
+            path = self.paths[pid]
+            ok = self._check(path)
+            if ok and pid not in self.eligible_ids:
+                self.eligible_ids.add(pid)
+                newly.append(path)
+            elif not ok:
+                self.eligible_ids.discard(pid)
+        return _order(newly)
+
+    @staticmethod
+    def _between(index: List[Tuple[float, str]], lo: float, hi: float, lo_open: bool, hi_open: bool) -> List[str]:
+        """
+        Path ids whose threshold lies between lo and hi.
+        """
+        i = bisect_right(index, (lo, _TOP)) if lo_open else bisect_left(index, (lo, ""))
+        j = bisect_left(index, (hi, "")) if hi_open else bisect_right(index, (hi, _TOP))
+        return [pid for _, pid in index[i:j]]
+
+    # =========================
+    # State changes
+    # =========================
+
+    def set_day(self, day: int) -> List[FuturePath]:
+        old, self.day = self.day, day
+        if day == old:
+            return []
+        lo, hi = min(old, day), max(old, day)
+        # min_day flips for thresholds in (lo, hi]
+        return self._recheck(self._between(self._min_day, lo, hi, True, False))
+
+    def set_cry(self, cry: float) -> List[FuturePath]:
+        old, self.cry = self.cry, cry
+        if cry == old:
+            return []
+        lo, hi = min(old, cry), max(old, cry)
+        # max_cry flips for thresholds in [lo, hi)
+        return self._recheck(self._between(self._max_cry, lo, hi, False, True))
+
+    def set_place(self, place: Optional[str]) -> List[FuturePath]:
+        old, self.place = self.place, place
+        if place == old:
+            return []
+        affected = set(self._place.get(old, ())) | set(self._place.get(place, ()))
+        return self._recheck(affected)
+
+    def set_word_count(self, word: str, count: int) -> List[FuturePath]:
+        old = self.words.get(word, 0)
+        self.words[word] = count
+        index = self._lexicon.get(word)
+        if index is None or count == old:
+            return []
+        lo, hi = min(old, count), max(old, count)
+        # min_lexicon flips for thresholds in (lo, hi]
+        return self._recheck(self._between(index, lo, hi, True, False))
+
+    def update(
+        self,
+        day: Optional[int] = None,
+        cry: Optional[float] = None,
+        place: Optional[str] = None,
+        words: Optional[Dict[str, int]] = None,
+    ) -> List[FuturePath]:
+        """
+        Apply several changes at once; `words` holds only counts that changed.
+        """
+        newly: Dict[str, FuturePath] = {}
+        if day is not None:
+            newly.update((p.path_id, p) for p in self.set_day(day))
+        if cry is not None:
+            newly.update((p.path_id, p) for p in self.set_cry(cry))
+        if place is not None:
+            newly.update((p.path_id, p) for p in self.set_place(place))
+        for word, count in (words or {}).items():
+            newly.update((p.path_id, p) for p in self.set_word_count(word, count))
+        # a later change in this batch may have closed a path again
+        return _order(p for pid, p in newly.items() if pid in self.eligible_ids)
+
+    def eligible(self, status: Optional[str] = None, limit: Optional[int] = None) -> List[FuturePath]:
+        """
+        Currently eligible paths, highest priority first.
+        """
+        items = _order(
+            self.paths[pid] for pid in self.eligible_ids
+            if status is None or self.paths[pid].status == status
+        )
+        return items if limit is None else items[:limit]
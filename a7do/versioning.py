@@ -0,0 +1,55 @@
+# a7do/versioning.py
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+
+class VersionClock:
+    """
+    Monotonic change counter shared by the tracked WorldProfiles sections.
+    """
+
+    def __init__(self):
+        self.version = 0
+
+    def bump(self) -> int:
+        self.version += 1
+        return self.version
+
+
+class ChangeSet:
+    """
+    key -> version of its last change, and of its removal. Both dicts are
+    kept in version order, so changes since v are read from the tail.
+    """
+
+    def __init__(self, clock: VersionClock):
+        self.clock = clock
+        self.changed: Dict[Any, int] = {}
+        self.removed: Dict[Any, int] = {}
+
+    def mark(self, key):
+        self.changed.pop(key, None)
+        self.changed[key] = self.clock.bump()
+        self.removed.pop(key, None)
+
+    def drop(self, key):
+        self.removed.pop(key, None)
+        self.removed[key] = self.clock.bump()
+        self.changed.pop(key, None)
+
+    @staticmethod
+    def _tail(log: Dict[Any, int], version: int) -> List[Any]:
+        out = []
+        for key in reversed(log):
+            if log[key] <= version:
+                break
+            out.append(key)
+        out.reverse()
+        return out
+
+    def since(self, version: int):
+        """
+        (changed keys, removed keys) after `version`.
+        """
+        return self._tail(self.changed, version), self._tail(self.removed, version)
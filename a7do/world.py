@@ -1,5 +1,7 @@
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, FrozenSet, Set
+
+from a7do.event_store import EventLog
 
 
 @dataclass
@@ -32,4 +34,62 @@ class WorldState:
     bots: Dict[str, BotState] = field(default_factory=dict)
 
     # 🔑 NEW: Persistent event history (observer truth)
-    event_log: List[dict] = field(default_factory=list)
\ No newline at end of file
+    # Pass EventLog(<dir>) to keep it across restarts. The world owns the
+    # log's files: world.event_log.close() releases them (a finalizer does
+    # it otherwise). deepcopy / pickle of the world work (see EventLog).
+    event_log: EventLog = field(default_factory=EventLog)
+
+    # Secondary index: location -> names of bots there. Kept current by
+    # add_bot / remove_bot / move_bot; after editing `bots` or a
+    # bot.location directly, call reindex_bots().
+    bots_by_location: Dict[str, Set[str]] = field(default_factory=dict, init=False)
+    _indexed_at: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        self.reindex_bots()
+
+    def _unindex_bot(self, name: str):
+        old = self._indexed_at.pop(name, None)
+        here = self.bots_by_location.get(old)
+        if here is not None:
+            here.discard(name)
+            if not here:
+                del self.bots_by_location[old]
+
+    def _index_bot(self, name: str, location: str):
+        if self._indexed_at.get(name) == location:
+            return
+        self._unindex_bot(name)
+        self.bots_by_location.setdefault(location, set()).add(name)
+        self._indexed_at[name] = location
+
+    def add_bot(self, bot: BotState):
+        self.bots[bot.name] = bot
+        self._index_bot(bot.name, bot.location)
+
+    def remove_bot(self, name: str) -> BotState:
+        bot = self.bots.pop(name)
+        self._unindex_bot(name)
+        return bot
+
+    def move_bot(self, name: str, location: str, day: int, event: int):
+        bot = self.bots[name]
+        bot.location = location
+        bot.last_seen_day = day
+        bot.last_seen_event = event
+        self._index_bot(name, location)
+
+    def reindex_bots(self):
+        """
+        Rebuild the location index, e.g. after editing bot.location directly.
+        """
+        self.bots_by_location.clear()
+        self._indexed_at.clear()
+        for name, bot in self.bots.items():
+            self._index_bot(name, bot.location)
+
+    def bots_at(self, location: str) -> FrozenSet[str]:
+        """
+        Names of the bots at a location.
+        """
+        return frozenset(self.bots_by_location.get(location, ()))
@@ -1,18 +1,31 @@
 # a7do_core/a7mind.py
 
-from typing import List
+from typing import List, Optional
 
 from a7do_core.familiarity import FamiliarityMemory
+from a7do_core.sensory_archive import SensoryArchive, SensoryRing
 
 
 class A7DOMind:
     """
     Core pre-symbolic mind.
     Receives sensory packets, tracks familiarity, sleeps.
+
+    Recent packets are held in a fixed-capacity ring (used for sleep
+    replay); older packets spill to an on-disk archive when
+    `archive_dir` is given.
+
+    Without `archive_dir` only the last `memory_capacity` packets are
+    kept (a warning is raised the first time one is dropped); pass an
+    archive_dir, or a larger capacity, to keep full history.
+    Reopening an existing archive_dir continues its positions; call
+    close() (or use the mind as a context manager) so packets still in
+    memory are written to the archive.
     """
 
-    def __init__(self):
-        self.sensory_memory: List = []
+    def __init__(self, memory_capacity: int = 5000, archive_dir: Optional[str] = None):
+        archive = SensoryArchive(archive_dir) if archive_dir else None
+        self.sensory_memory = SensoryRing(memory_capacity, archive)
         self.familiarity = FamiliarityMemory()
 
     def process_sensory_packet(self, packet):
@@ -20,17 +33,44 @@ class A7DOMind:
         Receive a sensory packet from the world bridge.
         """
         # Observe sensory patterns (wake phase)
-        for modality, values in packet.sensory.items():
-            for v in values:
-                self.familiarity.observe(modality, v)
+        self.familiarity.observe_batch(packet)
 
         self.sensory_memory.append(packet)
 
+    def history(self, start: int = 0, count: int = 50) -> List:
+        """
+        Page through all packets ever received, oldest first.
+        Archived packets are read from disk; the rest come from memory.
+        """
+        mem = self.sensory_memory
+        first_in_memory = mem.total - len(mem)
+        end = min(mem.total, start + count)
+
+        out: List = []
+        if start < first_in_memory and mem.archive is not None:
+            out.extend(mem.archive.read(start, min(end, first_in_memory) - start))
+        lo = max(start, first_in_memory) - first_in_memory
+        hi = end - first_in_memory
+        if hi > lo:
+            out.extend(mem[lo:hi])
+        return out
+
+    def close(self):
+        self.sensory_memory.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
     def snapshot(self):
         """
         Internal debug snapshot.
         """
         return {
             "sensory_memory_count": len(self.sensory_memory),
+            "sensory_archived_count": self.sensory_memory.archived,
+            "sensory_total_count": self.sensory_memory.total,
             "familiarity": self.familiarity.snapshot(),
-        }
\ No newline at end of file
+        }
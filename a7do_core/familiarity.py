@@ -1,37 +1,137 @@
 # a7do_core/familiarity.py
 
-from collections import defaultdict
-from typing import Tuple, Dict
+from array import array
+from collections import Counter
+from typing import Tuple, Dict, List, Optional
+
+
+RAW_CACHE_LIMIT = 4096   # raw spellings remembered before the cache is reset
 
 
 class FamiliarityMemory:
     """
     Tracks familiarity of sensory patterns.
     Familiarity is prediction confidence, not liking.
+
+    Patterns are interned: each normalised (modality, value) pair gets an
+    integer id the first time it is seen, and scores live in a flat array
+    indexed by that id.
     """
 
     def __init__(self):
-        self._scores = defaultdict(float)
+        self._ids: Dict[Tuple[str, str], int] = {}      # normalised key -> id
+        self._raw_ids: Dict[Tuple[str, str], int] = {}  # raw key -> id (bounded; skips re-normalising)
+        self._keys: List[Tuple[str, str]] = []          # id -> normalised key
+        self._scores = array("d")                       # id -> score
 
     def _key(self, modality: str, value: str) -> Tuple[str, str]:
         return (modality.strip().lower(), value.strip().lower())
 
+    def _id(self, modality: str, value: str) -> int:
+        """
+        Pattern id for (modality, value), interning it on first sight.
+        """
+        raw = (modality, value)
+        pid = self._raw_ids.get(raw)
+        if pid is not None:
+            return pid
+
+        key = self._key(modality, value)
+        pid = self._ids.get(key)
+        if pid is None:
+            pid = len(self._keys)
+            self._ids[key] = pid
+            self._keys.append(key)
+            self._scores.append(0.0)
+
+        if len(self._raw_ids) >= RAW_CACHE_LIMIT:
+            self._raw_ids.clear()
+        self._raw_ids[raw] = pid
+        return pid
+
+    def _lookup(self, modality: str, value: str) -> Optional[int]:
+        """
+        Pattern id for (modality, value) without interning it.
+        """
+        pid = self._raw_ids.get((modality, value))
+        if pid is None:
+            pid = self._ids.get(self._key(modality, value))
+        return pid
+
+    def _bump(self, pid: int, delta: float):
+        self._scores[pid] = min(1.0, self._scores[pid] + delta)
+
     def observe(self, modality: str, value: str, delta: float = 0.02):
         """
         Increase familiarity slightly during waking experience.
         """
-        key = self._key(modality, value)
-        self._scores[key] = min(1.0, self._scores[key] + delta)
+        self._bump(self._id(modality, value), delta)
 
     def reinforce(self, modality: str, value: str, delta: float = 0.01):
         """
         Reinforce familiarity during sleep replay.
         """
-        key = self._key(modality, value)
-        self._scores[key] = min(1.0, self._scores[key] + delta)
+        self._bump(self._id(modality, value), delta)
+
+    # -------------------------------------------------
+    # Batch updates
+    # -------------------------------------------------
+
+    def count_patterns(self, packets) -> Counter:
+        """
+        Count pattern occurrences across one packet or a list of packets.
+        """
+        if hasattr(packets, "sensory"):
+            packets = [packets]
+
+        counts: Counter = Counter()
+        for packet in packets:
+            for modality, values in packet.sensory.items():
+                for v in values:
+                    counts[self._id(modality, v)] += 1
+        return counts
+
+    def apply_counts(self, counts: Dict[int, int], delta: float):
+        """
+        Apply pre-aggregated per-pattern integer counts in one pass.
+        Each pattern gets `count` clamped +delta steps (stopping early at
+        1.0), so scores are bit-identical to calling observe / reinforce
+        once per occurrence. Counts must be ints; use apply_weights for
+        fractional weights.
+        """
+        scores = self._scores
+        for pid, n in counts.items():
+            v = scores[pid]
+            for _ in range(n):
+                if v >= 1.0:
+                    break
+                v = min(1.0, v + delta)
+            scores[pid] = v
+
+    def apply_weights(self, weights: Dict[int, float], delta: float):
+        """
+        Apply fractional per-pattern weights: one clamped +weight*delta
+        bump each. Not step-for-step identical to apply_counts.
+        """
+        scores = self._scores
+        for pid, w in weights.items():
+            scores[pid] = min(1.0, scores[pid] + w * delta)
+
+    def observe_batch(self, packets, delta: float = 0.02):
+        """
+        Waking observation of a whole packet (or list of packets).
+        """
+        self.apply_counts(self.count_patterns(packets), delta)
+
+    def reinforce_batch(self, packets, delta: float = 0.01):
+        """
+        Sleep reinforcement of a whole packet (or list of packets).
+        """
+        self.apply_counts(self.count_patterns(packets), delta)
 
     def get(self, modality: str, value: str) -> float:
-        return self._scores.get(self._key(modality, value), 0.0)
+        pid = self._lookup(modality, value)
+        return 0.0 if pid is None else self._scores[pid]
 
     def snapshot(self) -> Dict[str, float]:
         """
@@ -39,6 +139,6 @@ class FamiliarityMemory:
         """
         return {
             f"{k[0]}:{k[1]}": round(v, 3)
-            for k, v in self._scores.items()
+            for k, v in zip(self._keys, self._scores)
             if v >= 0.05
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,224 @@
+# a7do_core/sensory_archive.py
+
+import json
+import os
+import warnings
+from array import array
+from dataclasses import asdict
+from typing import Any, List, Optional
+
+from a7do_core.world_bridge import SensoryPacket
+
+
+class SensoryArchive:
+    """
+    Append-only on-disk history of sensory packets.
+
+    Packets are written as JSON lines into fixed-size segment files.
+    Each segment has a sidecar index of byte offsets, so any packet can
+    be read back by its archive position without scanning.
+
+        <root>/seg_000000.jsonl   one packet per line
+        <root>/seg_000000.idx     uint64 byte offset per line
+    """
+
+    def __init__(self, root: str, segment_size: int = 10000):
+        self.root = root
+        self.segment_size = segment_size
+        os.makedirs(root, exist_ok=True)
+
+        self._count = 0
+        self._data_fh = None
+        self._idx_fh = None
+
+        # Cached offsets of the most recently read segment
+        self._cached_seg: Optional[int] = None
+        self._cached_offsets = array("Q")
+
+        self._resume()
+
+    # -------------------------------------------------
+    # Paths
+    # -------------------------------------------------
+
+    def _data_path(self, seg: int) -> str:
+        return os.path.join(self.root, f"seg_{seg:06d}.jsonl")
+
+    def _idx_path(self, seg: int) -> str:
+        return os.path.join(self.root, f"seg_{seg:06d}.idx")
+
+    def _resume(self):
+        """
+        Pick up an existing archive: count records from segment indexes.
+        """
+        seg = 0
+        itemsize = array("Q").itemsize
+        while os.path.exists(self._idx_path(seg)):
+            self._count += os.path.getsize(self._idx_path(seg)) // itemsize
+            seg += 1
+
+    # -------------------------------------------------
+    # Writing
+    # -------------------------------------------------
+
+    def _open_segment(self, seg: int):
+        self.close()
+        self._data_fh = open(self._data_path(seg), "ab")
+        self._idx_fh = open(self._idx_path(seg), "ab")
+
+    def append(self, packet: SensoryPacket):
+        seg, pos = divmod(self._count, self.segment_size)
+        if self._data_fh is None or pos == 0:
+            self._open_segment(seg)
+
+        line = json.dumps(asdict(packet), separators=(",", ":"), default=str)
+        offset = self._data_fh.tell()
+        self._data_fh.write(line.encode("utf-8") + b"\n")
+        array("Q", [offset]).tofile(self._idx_fh)
+        self._count += 1
+
+        if self._cached_seg == seg:
+            self._cached_offsets.append(offset)
+
+    def flush(self):
+        if self._data_fh is not None:
+            self._data_fh.flush()
+            self._idx_fh.flush()
+
+    def close(self):
+        if self._data_fh is not None:
+            self._data_fh.close()
+            self._idx_fh.close()
+            self._data_fh = None
+            self._idx_fh = None
+
+    # -------------------------------------------------
+    # Reading
+    # -------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _offsets(self, seg: int) -> array:
+        if self._cached_seg != seg:
+            offsets = array("Q")
+            with open(self._idx_path(seg), "rb") as fh:
+                offsets.frombytes(fh.read())
+            self._cached_seg = seg
+            self._cached_offsets = offsets
+        return self._cached_offsets
+
+    def read(self, start: int, count: int = 50) -> List[SensoryPacket]:
+        """
+        Page through history: up to `count` packets from archive position `start`.
+        """
+        self.flush()
+        end = min(self._count, start + count)
+        out: List[SensoryPacket] = []
+
+        i = max(0, start)
+        while i < end:
+            seg, pos = divmod(i, self.segment_size)
+            offsets = self._offsets(seg)
+            n = min(end - i, self.segment_size - pos)
+            with open(self._data_path(seg), "rb") as fh:
+                fh.seek(offsets[pos])
+                for _ in range(n):
+                    out.append(SensoryPacket(**json.loads(fh.readline())))
+            i += n
+
+        return out
+
+
+class SensoryRing:
+    """
+    Fixed-capacity in-memory ring of recent sensory packets.
+
+    Behaves like a list of the packets still held in memory (len, index,
+    slice, iterate). Packets pushed out of the ring are handed to the
+    archive, if one is attached, otherwise they are dropped (with a
+    one-time warning).
+
+    Positions are global: with a reopened archive, `total` and `evicted`
+    start at the archive's length, so packet i of this session is
+    position len(archive) + i.
+    """
+
+    def __init__(self, capacity: int = 5000, archive: Optional[SensoryArchive] = None):
+        if capacity < 1:
+            raise ValueError(f"sensory ring capacity must be at least 1, got {capacity}")
+        self.capacity = capacity
+        self.archive = archive
+
+        self._buf: List[Any] = [None] * capacity
+        self._start = 0
+        self._len = 0
+        base = len(archive) if archive is not None else 0
+        self.total = base     # packets ever appended (all sessions)
+        self.evicted = base   # packets pushed out of memory
+        self._warned = False
+
+    def append(self, packet: SensoryPacket):
+        if self._len < self.capacity:
+            self._buf[(self._start + self._len) % self.capacity] = packet
+            self._len += 1
+        else:
+            old = self._buf[self._start]
+            if self.archive is not None:
+                self.archive.append(old)
+            elif not self._warned:
+                warnings.warn(
+                    f"sensory ring full ({self.capacity}); older packets are dropped "
+                    "because no archive is attached",
+                    stacklevel=2,
+                )
+                self._warned = True
+            self.evicted += 1
+            self._buf[self._start] = packet
+            self._start = (self._start + 1) % self.capacity
+        self.total += 1
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __bool__(self) -> bool:
+        return self._len > 0
+
+    def __iter__(self):
+        for i in range(self._len):
+            yield self._buf[(self._start + i) % self.capacity]
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._buf[(self._start + i) % self.capacity] for i in range(*key.indices(self._len))]
+        if key < 0:
+            key += self._len
+        if not 0 <= key < self._len:
+            raise IndexError("sensory ring index out of range")
+        return self._buf[(self._start + key) % self.capacity]
+
+    @property
+    def archived(self) -> int:
+        return len(self.archive) if self.archive is not None else 0
+
+    def spill(self):
+        """
+        Move every packet still in memory to the archive (no-op without one).
+        """
+        if self.archive is None:
+            return
+        for packet in self:
+            self.archive.append(packet)
+        self.evicted += self._len
+        self._buf = [None] * self.capacity
+        self._start = 0
+        self._len = 0
+        self.archive.flush()
+
+    def close(self):
+        """
+        Spill the ring into the archive and close the archive's files.
+        """
+        self.spill()
+        if self.archive is not None:
+            self.archive.close()
@@ -1,23 +1,95 @@
 # a7do_core/sleep.py
 
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass
+class ReplayPolicy:
+    """
+    How much of the day's experience is replayed during sleep.
+    """
+    window: int = 50                    # most recent packets eligible for replay
+    decay: float = 0.0                  # share of last night's table carried into tonight
+    max_replays: Optional[int] = None   # cap on replays per pattern per night
+    delta: float = 0.01                 # familiarity gained per replay
+
+
+# Carried replay weights below this are dropped from the table.
+_CARRY_FLOOR = 0.01
+
+
 class SleepProcessor:
     """
     Handles sleep consolidation.
+
+    Default mode rescans the replay window every night.
+    Incremental mode keeps a cursor into sensory_memory and only tables
+    packets that arrived since the last sleep.
     """
 
-    def __init__(self, mind):
+    def __init__(self, mind, policy: Optional[ReplayPolicy] = None, incremental: bool = False):
         self.mind = mind
+        self.policy = policy or ReplayPolicy()
+        self.incremental = incremental
+
+        self.cursor: int = 0                # packets already tabled
+        self.carry: Dict[int, float] = {}   # pattern id -> replay weight carried over
 
     def sleep_cycle(self):
         """
         Replay recent sensory experiences to stabilise familiarity.
         """
+        if self.incremental:
+            self._incremental_cycle()
+            return
+
         if not self.mind.sensory_memory:
             return
 
-        recent_packets = self.mind.sensory_memory[-50:]
+        recent_packets = self.mind.sensory_memory[-self.policy.window:]
+
+        self.mind.familiarity.reinforce_batch(recent_packets, self.policy.delta)
+
+    def _incremental_cycle(self):
+        """
+        Build tonight's per-pattern count table from new packets only,
+        fold in decayed carry-over, cap it, and apply it in one pass.
+        """
+        policy = self.policy
+        memory = self.mind.sensory_memory
+
+        # Cursor counts packets ever received, so it survives ring eviction
+        total = getattr(memory, "total", len(memory))
+        fresh = min(total - self.cursor, policy.window, len(memory))
+        new_counts = self.mind.familiarity.count_patterns(memory[len(memory) - fresh:] if fresh > 0 else [])
+        self.cursor = total
+
+        carried: Dict[int, float] = {}
+        if policy.decay > 0.0:
+            for pid, w in self.carry.items():
+                w *= policy.decay
+                if w >= _CARRY_FLOOR:
+                    carried[pid] = w
+
+        # New packets replay in whole steps; the carry is one fractional
+        # bump. The cap covers both, new packets first.
+        counts: Dict[int, int] = dict(new_counts)
+        if policy.max_replays is not None:
+            cap = policy.max_replays
+            for pid, n in counts.items():
+                if n > cap:
+                    counts[pid] = cap
+            for pid, w in carried.items():
+                room = cap - counts.get(pid, 0)
+                if w > room:
+                    carried[pid] = float(max(room, 0))
+
+        familiarity = self.mind.familiarity
+        familiarity.apply_weights(carried, policy.delta)
+        familiarity.apply_counts(counts, policy.delta)
 
-        for packet in recent_packets:
-            for modality, values in packet.sensory.items():
-                for v in values:
-                    self.mind.familiarity.reinforce(modality, v)
\ No newline at end of file
+        tonight = {pid: w for pid, w in carried.items() if w > 0.0}
+        for pid, n in counts.items():
+            tonight[pid] = tonight.get(pid, 0.0) + n
+        self.carry = tonight
@@ -1,7 +1,9 @@
 # a7do_core/world_bridge.py
 
 from dataclasses import dataclass
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+from world_frame.compact import DEFAULT_TABLE, SensoryPayload, StringTable
 
 
 @dataclass
@@ -13,6 +15,41 @@ class SensoryPacket:
     time: float
 
 
+class CompactSensoryPacket:
+    """
+    Slotted, interned form of SensoryPacket.
+    Place, tags and sensory values are ids into a shared StringTable.
+    """
+
+    __slots__ = ("place", "sensory", "body", "tags", "time")
+
+    def __init__(self, place: int, sensory: SensoryPayload, body: Optional[Dict[str, Any]], tags: Tuple[int, ...], time: float):
+        self.place = place
+        self.sensory = sensory
+        self.body = body          # None when empty
+        self.tags = tags
+        self.time = time
+
+    @classmethod
+    def from_packet(cls, packet: SensoryPacket, table: StringTable = DEFAULT_TABLE) -> "CompactSensoryPacket":
+        return cls(
+            place=table.intern(packet.place),
+            sensory=table.encode_sensory(packet.sensory),
+            body=packet.body or None,
+            tags=table.ids(packet.tags),
+            time=packet.time,
+        )
+
+    def to_packet(self, table: StringTable = DEFAULT_TABLE) -> SensoryPacket:
+        return SensoryPacket(
+            place=table.string(self.place),
+            sensory=table.decode_sensory(self.sensory),
+            body=dict(self.body or {}),
+            tags=table.strs(self.tags),
+            time=self.time,
+        )
+
+
 class WorldToA7DOBridge:
     """
     Converts WorldEvents into sensory packets.
@@ -20,6 +57,7 @@ class WorldToA7DOBridge:
 
     def __init__(self):
         self.last_world_time: float = 0.0
+        self.cursor: int = 0    # next world event sequence number to pull
 
     def translate_event(self, world_event) -> Optional[SensoryPacket]:
         sensory = world_event.sensory or {}
@@ -38,13 +76,18 @@ class WorldToA7DOBridge:
         )
 
     def pull_new_packets(self, world_state) -> List[SensoryPacket]:
+        """
+        Translate events recorded since the last pull.
+        Tracks a sequence cursor, so each event is seen exactly once,
+        including across the midnight wrap of world time.
+        """
         packets = []
 
-        for ev in world_state.events:
-            if ev.time >= self.last_world_time:
-                pkt = self.translate_event(ev)
-                if pkt:
-                    packets.append(pkt)
+        for ev in world_state.events_since(self.cursor):
+            pkt = self.translate_event(ev)
+            if pkt:
+                packets.append(pkt)
 
+        self.cursor = world_state.next_seq
         self.last_world_time = world_state.time
-        return packets
\ No newline at end of file
+        return packets
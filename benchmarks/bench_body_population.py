@@ -0,0 +1,58 @@
+# benchmarks/bench_body_population.py
+"""
+Throughput of BiologicalPopulation vs. a Python loop over
+BiologicalState objects, for the same simulated ticks.
+
+    python -m benchmarks.bench_body_population [cohort_size] [ticks]
+"""
+
+import sys
+import time
+
+from a7do.body import BiologicalState
+from a7do.body_population import BiologicalPopulation
+
+
+def tick_loop(bodies, t: int):
+    for b in bodies:
+        b.update()
+        if t % 4 == 0:
+            b.feed()
+        if t % 3 == 0:
+            b.soothe()
+        b.cry_level()
+
+
+def tick_population(pop: BiologicalPopulation, t: int):
+    pop.update()
+    if t % 4 == 0:
+        pop.feed()
+    if t % 3 == 0:
+        pop.soothe()
+    pop.cry_level()
+
+
+def main(size: int = 10000, ticks: int = 100):
+    bodies = [BiologicalState() for _ in range(size)]
+    t0 = time.perf_counter()
+    for t in range(ticks):
+        tick_loop(bodies, t)
+    loop_s = time.perf_counter() - t0
+
+    pop = BiologicalPopulation(size)
+    t0 = time.perf_counter()
+    for t in range(ticks):
+        tick_population(pop, t)
+    pop_s = time.perf_counter() - t0
+
+    same = all(pop[i].snapshot() == bodies[i].snapshot() for i in range(0, size, max(1, size // 100)))
+
+    print(f"{size} bodies x {ticks} ticks")
+    print(f"python loop   {size * ticks / loop_s:14,.0f} body-ticks/s")
+    print(f"population    {size * ticks / pop_s:14,.0f} body-ticks/s  ({loop_s / pop_s:.1f}x)")
+    print(f"snapshots match: {same}")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
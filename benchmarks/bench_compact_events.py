@@ -0,0 +1,90 @@
+# benchmarks/bench_compact_events.py
+"""
+Bytes per event: WorldEvent / SensoryPacket dataclasses vs. their
+compact, interned forms.
+
+Strings are re-decoded per event to model events loaded from disk or
+built at runtime (literals in source would already be shared).
+
+    python -m benchmarks.bench_compact_events [n_events]
+"""
+
+import sys
+import tracemalloc
+
+from a7do_core.world_bridge import CompactSensoryPacket, SensoryPacket
+from world_frame.compact import CompactWorldEvent, StringTable
+from world_frame.world_state import WorldEvent
+
+
+TEMPLATES = [
+    ("Home", "Parent speaks softly nearby", ["care"], {"sound": ["soft voice"]}),
+    ("Home", "Being held gently", ["comfort"], {"touch": ["warm arms"]}),
+    ("Hospital", "Nurse gently checks body", ["care"],
+     {"touch": ["hands", "pressure"], "sound": ["soft voice"], "visual": ["faces"]}),
+    ("Hospital", "Bright hospital lights overhead", ["light"], {"visual": ["bright light"]}),
+    ("Journey", "Vehicle movement and engine noise", ["movement"],
+     {"motion": ["movement"], "sound": ["engine noise"], "visual": ["passing light"]}),
+]
+
+
+def _fresh(s: str) -> str:
+    return s.encode("utf-8").decode("utf-8")
+
+
+def make_events(n: int):
+    out = []
+    for i in range(n):
+        place, desc, tags, sensory = TEMPLATES[i % len(TEMPLATES)]
+        out.append(WorldEvent(
+            time=i * 0.5,
+            place=_fresh(place),
+            description=_fresh(desc),
+            tags=[_fresh(t) for t in tags],
+            sensory={_fresh(k): [_fresh(v) for v in vs] for k, vs in sensory.items()},
+        ))
+    return out
+
+
+def measure(build, n: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build(n)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / n
+
+
+def main(n: int = 50000):
+    table = StringTable()
+
+    def plain_events(k):
+        return make_events(k)
+
+    def compact_events(k):
+        return [CompactWorldEvent.from_event(ev, table) for ev in make_events(k)]
+
+    def plain_packets(k):
+        return [SensoryPacket(ev.place, ev.sensory, {}, ev.tags, ev.time) for ev in make_events(k)]
+
+    def compact_packets(k):
+        return [
+            CompactSensoryPacket.from_packet(SensoryPacket(ev.place, ev.sensory, {}, ev.tags, ev.time), table)
+            for ev in make_events(k)
+        ]
+
+    rows = [
+        ("WorldEvent", measure(plain_events, n)),
+        ("CompactWorldEvent", measure(compact_events, n)),
+        ("SensoryPacket", measure(plain_packets, n)),
+        ("CompactSensoryPacket", measure(compact_packets, n)),
+    ]
+
+    print(f"{n} events, {len(table)} interned strings")
+    for name, bpe in rows:
+        print(f"{name:<22} {bpe:8.1f} bytes/event")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1,71 @@
+# benchmarks/bench_neighbourhood.py
+"""
+Doors per second for WorldProfiles.generate_neighbours: the columnar
+neighbour store vs. the previous per-door loop that built every
+PersonProfile up front.
+
+    python -m benchmarks.bench_neighbourhood [n_doors]
+"""
+
+import random
+import sys
+import time
+
+from a7do.profiles import PersonProfile, WorldProfiles
+
+
+M = ["James", "Craig", "Tom", "Mark", "Owen", "Liam", "Noah", "Leo", "Finn", "Alex"]
+F = ["Sarah", "Mags", "Emma", "Sophie", "Zoe", "Ava", "Mia", "Ella", "Grace", "Lucy"]
+HAIR = ["brown", "blonde", "black", "red", "grey"]
+EYES = ["blue", "green", "brown", "hazel"]
+
+
+def eager_generate(seed: int, doors):
+    """The old loop, standard-family branch only (that is ~all doors)."""
+    rng = random.Random(seed)
+    people, families = {}, {}
+    for door in doors:
+        dad = f"{rng.choice(M)}_{door}_Dad"
+        mum = f"{rng.choice(F)}_{door}_Mum"
+        c1 = f"{rng.choice(M)}_{door}_Boy"
+        c2 = f"{rng.choice(F)}_{door}_Girl"
+        people[dad] = PersonProfile(dad, "neighbour_dad", rng.randint(24, 50), rng.choice(HAIR), rng.choice(EYES), ["hello wave"])
+        people[mum] = PersonProfile(mum, "neighbour_mum", rng.randint(24, 50), rng.choice(HAIR), rng.choice(EYES), ["warm smile"])
+        people[c1] = PersonProfile(c1, "neighbour_child", rng.randint(4, 10), rng.choice(HAIR), rng.choice(EYES), [])
+        people[c2] = PersonProfile(c2, "neighbour_child", rng.randint(4, 10), rng.choice(HAIR), rng.choice(EYES), [])
+        families[door] = {"style": "standard", "dad": dad, "mum": mum, "child1": c1, "child2": c2}
+    return people, families
+
+
+def main(n_doors: int = 50000):
+    doors = [str(i) for i in range(1, n_doors + 1)]
+
+    t0 = time.perf_counter()
+    people, _ = eager_generate(1, doors)
+    eager_s = time.perf_counter() - t0
+
+    wp = WorldProfiles()
+    t0 = time.perf_counter()
+    wp.generate_neighbours(1, doors)
+    col_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    wp.people.population.locate("")   # builds the name -> (row, slot) index
+    index_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    fams = [wp.neighbour_families[d] for d in doors[::100]]
+    names = [f["mum"] if "mum" in f and not f["mum"].startswith("unknown") else f["dad"] for f in fams]
+    profiles = [wp.people[n] for n in names]
+    lookup_s = time.perf_counter() - t0
+
+    print(f"{n_doors} doors, {len(wp.people)} neighbours")
+    print(f"eager loop       {n_doors / eager_s:14,.0f} doors/s")
+    print(f"columnar store   {n_doors / col_s:14,.0f} doors/s  ({eager_s / col_s:.1f}x)")
+    print(f"name index       {index_s * 1000:14,.1f} ms (once, on first lookup)")
+    print(f"lazy lookup      {len(profiles) / lookup_s:14,.0f} family+profile/s")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:2]]
+    main(*args)
@@ -0,0 +1,40 @@
+# benchmarks/bench_newborn_days.py
+"""
+Days/second for NewbornRoutine.build_days at different worker counts,
+checked against serial build_day output.
+
+    python -m benchmarks.bench_newborn_days [n_days]
+"""
+
+import os
+import sys
+import time
+from dataclasses import asdict
+
+from a7do.newborn_routine import DayCache, NewbornConfig, NewbornRoutine
+
+
+def main(n_days: int = 2000):
+    cfg = NewbornConfig(days=n_days)
+    serial = NewbornRoutine(seed=7, config=cfg)
+    reference = [[asdict(ev) for ev in serial.build_day(d)] for d in range(n_days)]
+
+    counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    print(f"{n_days} days, {os.cpu_count()} CPUs")
+    for workers in counts:
+        routine = NewbornRoutine(seed=7, config=cfg)
+        t0 = time.perf_counter()
+        out = [[asdict(ev) for ev in evs] for _, evs in routine.build_days(range(n_days), workers=workers, chunksize=32)]
+        dt = time.perf_counter() - t0
+        print(f"workers={workers:<3} {n_days / dt:10,.0f} days/s  identical={out == reference}")
+
+    cached = NewbornRoutine(seed=7, config=cfg, cache=DayCache())
+    list(cached.build_days(range(n_days)))
+    t0 = time.perf_counter()
+    list(cached.build_days(range(n_days)))
+    dt = time.perf_counter() - t0
+    print(f"cached      {n_days / dt:10,.0f} days/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,36 @@
+# tests/test_event_store.py
+
+import pickle
+
+import pytest
+
+from a7do.event_store import EventLog
+
+
+def _recs(n):
+    return [{"day": i // 2, "index": i % 2, "kind": "k", "place": f"p{i}", "notes": None} for i in range(n)]
+
+
+def test_closed_log_refuses_writes_and_keeps_history(tmp_path):
+    log = EventLog(str(tmp_path), segment_size=4)
+    log.extend(_recs(6))
+    log.close()
+    with pytest.raises(ValueError):
+        log.append(_recs(1)[0])
+
+    with EventLog(str(tmp_path)) as reopened:
+        assert list(reopened) == _recs(6)
+
+
+def test_one_open_log_per_root(tmp_path):
+    log = EventLog(str(tmp_path))
+    log.extend(_recs(3))
+    blob = pickle.dumps(log)
+    with pytest.raises(ValueError):
+        pickle.loads(blob)
+    with pytest.raises(ValueError):
+        EventLog(str(tmp_path))
+
+    log.close()
+    with pickle.loads(blob) as again:
+        assert list(again) == _recs(3)
@@ -0,0 +1,29 @@
+# tests/test_relationships.py
+
+from a7do.profiles import PersonProfile, WorldProfiles
+
+
+def test_profile_edits_reach_the_graph():
+    wp = WorldProfiles()
+    wp.people["Mum"] = PersonProfile("Mum", "mum", 30, "brown", "blue")
+
+    assert wp.people["Mum"].add_relationship("pet", "Rex")
+    assert wp.related("Mum", "pet") == {"Rex"}
+    assert wp.related_to("Rex", "pet") == {"Mum"}
+
+    wp.people["Mum"].relationships = {"friend": ["Ann"]}
+    assert not wp.related("Mum", "pet")
+    assert wp.related("Mum", "friend") == {"Ann"}
+
+
+def test_generated_families_are_in_the_graph():
+    wp = WorldProfiles()
+    wp.generate_neighbours(1, [str(d) for d in range(12)])
+    for door in range(12):
+        fam = wp.neighbour_families[str(door)]
+        parents = {v for k, v in fam.items() if k in ("dad", "mum", "stepdad") and not v.startswith("unknown_")}
+        kids = {fam["child1"], fam["child2"]}
+        assert wp.related(fam["child1"], "parent") == parents
+        for p in parents:
+            assert wp.related_to(p, "parent") == kids
+        assert wp.related(fam["child1"], "sibling") == {fam["child2"]}
@@ -0,0 +1,50 @@
+# tests/test_sleep.py
+
+import pytest
+
+from a7do_core.a7mind import A7DOMind
+from a7do_core.sleep import ReplayPolicy, SleepProcessor
+from a7do_core.world_bridge import SensoryPacket
+
+
+def _packet(t: float, sound: str = "voice") -> SensoryPacket:
+    return SensoryPacket("home", {"sound": [sound], "light": ["soft"]}, {}, [], t)
+
+
+def _night(mind: A7DOMind, sleep: SleepProcessor, start: int, n: int = 5):
+    for t in range(start, start + n):
+        mind.process_sensory_packet(_packet(float(t)))
+    sleep.sleep_cycle()
+
+
+@pytest.mark.parametrize("decay", [0.0, 0.5])
+def test_incremental_sleep_runs_and_reinforces(decay):
+    mind = A7DOMind(memory_capacity=100)
+    sleep = SleepProcessor(mind, ReplayPolicy(decay=decay), incremental=True)
+
+    _night(mind, sleep, 0)
+    first = mind.familiarity.get("sound", "voice")
+    assert first > 0.0
+    assert sleep.cursor == 5
+
+    _night(mind, sleep, 5)
+    assert mind.familiarity.get("sound", "voice") > first
+
+
+def test_incremental_sleep_carry_only_night():
+    mind = A7DOMind(memory_capacity=100)
+    sleep = SleepProcessor(mind, ReplayPolicy(decay=0.5), incremental=True)
+    _night(mind, sleep, 0)
+    before = mind.familiarity.get("sound", "voice")
+
+    sleep.sleep_cycle()   # no new packets: only the decayed carry replays
+    after = mind.familiarity.get("sound", "voice")
+    assert after == pytest.approx(min(1.0, before + 5 * 0.5 * sleep.policy.delta))
+
+
+def test_incremental_sleep_respects_cap():
+    mind = A7DOMind(memory_capacity=100)
+    sleep = SleepProcessor(mind, ReplayPolicy(decay=0.9, max_replays=2), incremental=True)
+    _night(mind, sleep, 0)
+    _night(mind, sleep, 5)
+    assert all(w <= 2 for w in sleep.carry.values())
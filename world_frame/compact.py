@@ -0,0 +1,99 @@
+# world_frame/compact.py
+
+from typing import Dict, List, Sequence, Tuple
+
+from world_frame.world_state import WorldEvent
+
+
+# (modality_id, (value_id, ...)) pairs, in original dict order
+SensoryPayload = Tuple[Tuple[int, Tuple[int, ...]], ...]
+
+
+class StringTable:
+    """
+    Shared string table.
+    Each distinct string is stored once and referred to by an integer id.
+    Identical id-tuples (tags, sensory payloads) are also shared, so
+    repeated events point at the same tuple object.
+    """
+
+    __slots__ = ("_ids", "_strings", "_tuples")
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._strings: List[str] = []
+        self._tuples: Dict[tuple, tuple] = {}
+
+    def intern(self, s: str) -> int:
+        i = self._ids.get(s)
+        if i is None:
+            i = len(self._strings)
+            self._ids[s] = i
+            self._strings.append(s)
+        return i
+
+    def string(self, i: int) -> str:
+        return self._strings[i]
+
+    def shared(self, t: tuple) -> tuple:
+        """
+        Canonical instance of an id-tuple.
+        """
+        return self._tuples.setdefault(t, t)
+
+    def ids(self, strings: Sequence[str]) -> Tuple[int, ...]:
+        return self.shared(tuple(self.intern(s) for s in strings))
+
+    def strs(self, ids: Sequence[int]) -> List[str]:
+        return [self._strings[i] for i in ids]
+
+    def encode_sensory(self, sensory: Dict[str, List[str]]) -> SensoryPayload:
+        return self.shared(tuple(
+            (self.intern(modality), self.ids(values))
+            for modality, values in sensory.items()
+        ))
+
+    def decode_sensory(self, payload: SensoryPayload) -> Dict[str, List[str]]:
+        return {self._strings[m]: self.strs(vs) for m, vs in payload}
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+
+# Process-wide table used when callers don't bring their own
+DEFAULT_TABLE = StringTable()
+
+
+class CompactWorldEvent:
+    """
+    Slotted, interned form of WorldEvent.
+    Strings are table ids; tags and sensory are shared tuples.
+    """
+
+    __slots__ = ("time", "place", "description", "tags", "sensory")
+
+    def __init__(self, time: float, place: int, description: int, tags: Tuple[int, ...], sensory: SensoryPayload):
+        self.time = time
+        self.place = place
+        self.description = description
+        self.tags = tags
+        self.sensory = sensory
+
+    @classmethod
+    def from_event(cls, ev: WorldEvent, table: StringTable = DEFAULT_TABLE) -> "CompactWorldEvent":
+        return cls(
+            time=ev.time,
+            place=table.intern(ev.place),
+            description=table.intern(ev.description),
+            tags=table.ids(ev.tags),
+            sensory=table.encode_sensory(ev.sensory),
+        )
+
+    def to_event(self, table: StringTable = DEFAULT_TABLE) -> WorldEvent:
+        return WorldEvent(
+            time=self.time,
+            place=table.string(self.place),
+            description=table.string(self.description),
+            tags=table.strs(self.tags),
+            sensory=table.decode_sensory(self.sensory),
+        )
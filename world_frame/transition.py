@@ -15,7 +15,7 @@ def apply_transition(
 
     world.current_place = to_place
 
-    world.events.append(
+    world.record_event(
         WorldEvent(
             time=world.time,
             place=to_place,
@@ -1,7 +1,8 @@
 # world_frame/world_state.py
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 
 @dataclass
@@ -26,6 +27,52 @@ class WorldState:
 
     events: List[WorldEvent] = field(default_factory=list)
 
+    # (day, time) of each event, parallel to `events`.
+    # An event's sequence number is its position in `events`.
+    _event_keys: List[Tuple[int, float]] = field(default_factory=list, init=False, repr=False)
+
+    # -------------------------------------------------
+    # Event store
+    # -------------------------------------------------
+
+    def record_event(self, ev: WorldEvent) -> int:
+        """
+        Append an event stamped with the current (day, time).
+        Returns its sequence number.
+        """
+        self._sync_index()
+        self.events.append(ev)
+        self._event_keys.append((self.day, ev.time))
+        return len(self.events) - 1
+
+    def _sync_index(self):
+        # Events appended straight onto `events` get the current day
+        for ev in self.events[len(self._event_keys):]:
+            self._event_keys.append((self.day, ev.time))
+
+    @property
+    def next_seq(self) -> int:
+        return len(self.events)
+
+    def events_since(self, seq: int) -> List[WorldEvent]:
+        """
+        Events with sequence number >= seq, in order. O(k).
+        """
+        return self.events[seq:]
+
+    def seq_at(self, day: int, time: float) -> int:
+        """
+        Sequence number of the first event at or after (day, time). O(log n).
+        """
+        self._sync_index()
+        return bisect_left(self._event_keys, (day, time))
+
+    def events_between(self, start: Tuple[int, float], end: Tuple[int, float]) -> List[WorldEvent]:
+        """
+        Events with start <= (day, time) < end.
+        """
+        return self.events[self.seq_at(*start):self.seq_at(*end)]
+
     # -------------------------------------------------
     # World transitions
     # -------------------------------------------------
@@ -34,7 +81,7 @@ class WorldState:
         if not self.birthed:
             self.birthed = True
             self.current_place = "Hospital"
-            self.events.append(
+            self.record_event(
                 WorldEvent(
                     time=self.time,
                     place="Hospital",
@@ -50,7 +97,7 @@ class WorldState:
 
     def move_to(self, place: str, description: str = ""):
         self.current_place = place
-        self.events.append(
+        self.record_event(
             WorldEvent(
                 time=self.time,
                 place=place,